@@ -4,9 +4,32 @@
 
 import smartpy as sp
 
-# Import the extendedFa2Contract module
+# Import the extendedFa2Contract and fa2TestUtils modules
 extendedFa2Contract = sp.io.import_script_from_url(
     "file:python/contracts/extendedFa2Contract.py")
+fa2TestUtils = sp.io.import_script_from_url(
+    "file:python/tests/fa2TestUtils.py")
+
+# Create the test accounts
+ADMIN = sp.test_account("admin")
+USER1 = sp.test_account("user1")
+USER2 = sp.test_account("user2")
+USER3 = sp.test_account("user3")
+
+# Define the token metadata links that are used in several tests
+IPFS_AAA = sp.utils.bytes_of_string("ipfs://aaa")
+IPFS_BBB = sp.utils.bytes_of_string("ipfs://bbb")
+
+# Define the token royalties that are used in several tests
+USER1_ROYALTIES = sp.record(
+    minter=sp.record(address=USER1.address, royalties=0),
+    creator=sp.record(address=USER1.address, royalties=100))
+USER2_ROYALTIES = sp.record(
+    minter=sp.record(address=USER2.address, royalties=0),
+    creator=sp.record(address=USER2.address, royalties=100))
+USER1_USER2_ROYALTIES = sp.record(
+    minter=sp.record(address=USER1.address, royalties=0),
+    creator=sp.record(address=USER2.address, royalties=50))
 
 
 class DummyContract(sp.Contract):
@@ -32,9 +55,7 @@ class DummyContract(sp.Contract):
 
         """
         # Define the input parameter data type
-        sp.set_type(params, sp.TList(sp.TRecord(
-                request=sp.TRecord(owner=sp.TAddress, token_id=sp.TNat).layout(("owner", "token_id")),
-                balance=sp.TNat).layout(("request", "balance"))))
+        sp.set_type(params, fa2TestUtils.BALANCE_CALLBACK_TYPE)
 
         # Save the returned information in the balances big map
         with sp.for_("balance_info", params) as balance_info:
@@ -47,30 +68,62 @@ def get_test_environment():
     # Initialize the test scenario
     scenario = sp.test_scenario()
 
-    # Create the test accounts
-    admin = sp.test_account("admin")
-    user1 = sp.test_account("user1")
-    user2 = sp.test_account("user2")
-    user3 = sp.test_account("user3")
-
     # Initialize the extended FA2 contract
     fa2 = extendedFa2Contract.FA2(
-        administrator=admin.address,
+        administrator=ADMIN.address,
         metadata=sp.utils.metadata_of_url("ipfs://aaa"))
     scenario += fa2
 
     # Save all the variables in a test environment dictionary
     testEnvironment = {
         "scenario": scenario,
-        "admin": admin,
-        "user1": user1,
-        "user2": user2,
-        "user3": user3,
+        "admin": ADMIN,
+        "user1": USER1,
+        "user2": USER2,
+        "user3": USER3,
         "fa2": fa2}
 
     return testEnvironment
 
 
+def check_balances(scenario, fa2, balances):
+    """Checks a list of (owner, token_id, balance) token balances through the
+    get_balance on-chain view, one scenario verification per balance.
+
+    """
+    for owner, token_id, balance in balances:
+        scenario.verify(
+            fa2.get_balance(fa2TestUtils.balance_request(owner, token_id)) == balance)
+
+
+def check_operators(scenario, fa2, operators):
+    """Checks a list of (owner, operator, token_id, is_operator) token
+    operators through the is_operator on-chain view, one scenario
+    verification per operator.
+
+    """
+    for owner, operator, token_id, is_operator in operators:
+        scenario.verify(fa2.is_operator(sp.record(
+            owner=owner, operator=operator, token_id=token_id)) == is_operator)
+
+
+def mint_two_tokens(fa2, admin):
+    """Mints 10 editions of a token owned by user1 and 20 editions of a token
+    owned by user2.
+
+    """
+    fa2.mint(
+        amount=10,
+        metadata={"": IPFS_AAA},
+        data={},
+        royalties=USER1_ROYALTIES).run(sender=admin)
+    fa2.mint(
+        amount=20,
+        metadata={"": IPFS_BBB},
+        data={},
+        royalties=USER2_ROYALTIES).run(sender=admin)
+
+
 @sp.add_test(name="Test mint")
 def test_mint():
     # Get the test environment
@@ -83,11 +136,9 @@ def test_mint():
 
     # Check that the admin can mint
     editions = 5
-    metadata = {"": sp.utils.bytes_of_string("ipfs://aaa")}
+    metadata = {"": IPFS_AAA}
     data = {"code": sp.utils.bytes_of_string("print('hello world')")}
-    royalties = sp.record(
-        minter=sp.record(address=user1.address, royalties=0),
-        creator=sp.record(address=user2.address, royalties=50))
+    royalties = USER1_USER2_ROYALTIES
     fa2.mint(
         amount=editions,
         metadata=metadata,
@@ -95,14 +146,15 @@ def test_mint():
         royalties=royalties).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == editions)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user1.address, 0)) == editions)
     scenario.verify(fa2.total_supply(0) == editions)
     scenario.verify(fa2.token_metadata(0).token_info[""] == metadata[""])
     scenario.verify(fa2.token_data(0)["code"] == data["code"])
-    scenario.verify(fa2.token_royalties(0).minter.address == user1.address)
-    scenario.verify(fa2.token_royalties(0).minter.royalties == 0)
-    scenario.verify(fa2.token_royalties(0).creator.address == user2.address)
-    scenario.verify(fa2.token_royalties(0).creator.royalties == 50)
+    token_royalties = scenario.compute(fa2.token_royalties(0))
+    scenario.verify(token_royalties.minter.address == user1.address)
+    scenario.verify(token_royalties.minter.royalties == 0)
+    scenario.verify(token_royalties.creator.address == user2.address)
+    scenario.verify(token_royalties.creator.royalties == 50)
     scenario.verify(fa2.token_exists(0))
     scenario.verify(~fa2.token_exists(1))
     scenario.verify(fa2.count_tokens() == 1)
@@ -127,7 +179,7 @@ def test_mint():
 
     # Mint the next token
     new_editions = 5
-    new_metadata = {"": sp.utils.bytes_of_string("ipfs://bbb")}
+    new_metadata = {"": IPFS_BBB}
     new_data = {"description": sp.utils.bytes_of_string("my token description")}
     new_royalties = sp.record(
         minter=sp.record(address=user2.address, royalties=10),
@@ -139,22 +191,24 @@ def test_mint():
         royalties=new_royalties).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == editions)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=1)) == new_editions)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user1.address, 0)) == editions)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user2.address, 1)) == new_editions)
     scenario.verify(fa2.total_supply(0) == editions)
     scenario.verify(fa2.total_supply(1) == new_editions)
     scenario.verify(fa2.token_metadata(0).token_info[""] == metadata[""])
     scenario.verify(fa2.token_metadata(1).token_info[""] == new_metadata[""])
     scenario.verify(fa2.token_data(0)["code"] == data["code"])
     scenario.verify(fa2.token_data(1)["description"] == new_data["description"])
-    scenario.verify(fa2.token_royalties(0).minter.address == user1.address)
-    scenario.verify(fa2.token_royalties(0).minter.royalties == 0)
-    scenario.verify(fa2.token_royalties(0).creator.address == user2.address)
-    scenario.verify(fa2.token_royalties(0).creator.royalties == 50)
-    scenario.verify(fa2.token_royalties(1).minter.address == user2.address)
-    scenario.verify(fa2.token_royalties(1).minter.royalties == 10)
-    scenario.verify(fa2.token_royalties(1).creator.address == user2.address)
-    scenario.verify(fa2.token_royalties(1).creator.royalties == 100)
+    token_royalties = scenario.compute(fa2.token_royalties(0))
+    scenario.verify(token_royalties.minter.address == user1.address)
+    scenario.verify(token_royalties.minter.royalties == 0)
+    scenario.verify(token_royalties.creator.address == user2.address)
+    scenario.verify(token_royalties.creator.royalties == 50)
+    new_token_royalties = scenario.compute(fa2.token_royalties(1))
+    scenario.verify(new_token_royalties.minter.address == user2.address)
+    scenario.verify(new_token_royalties.minter.royalties == 10)
+    scenario.verify(new_token_royalties.creator.address == user2.address)
+    scenario.verify(new_token_royalties.creator.royalties == 100)
     scenario.verify(fa2.token_exists(0))
     scenario.verify(fa2.token_exists(1))
     scenario.verify(~fa2.token_exists(2))
@@ -177,75 +231,72 @@ def test_transfer():
     editions = 15
     fa2.mint(
         amount=editions,
-        metadata={"": sp.utils.bytes_of_string("ipfs://aaa")},
+        metadata={"": IPFS_AAA},
         data={},
-        royalties=sp.record(
-            minter=sp.record(address=user1.address, royalties=0),
-            creator=sp.record(address=user2.address, royalties=50))
-        ).run(sender=admin)
+        royalties=USER1_USER2_ROYALTIES).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == editions)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user1.address, 0)) == editions)
     scenario.verify(fa2.total_supply(0) == editions)
 
     # Check that the creator cannot transfer the token
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user2.address, token_id=0, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user2.address, 0, 3)])
         ]).run(valid=False, sender=user2)
 
     # Check that another user cannot transfer the token
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=0, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, 0, 3)])
         ]).run(valid=False, sender=user3)
 
     # Check that the admin cannot transfer the token
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user2.address, token_id=0, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user2.address, 0, 3)])
         ]).run(valid=False, sender=admin)
 
     # Check that the owner can transfer the token
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=0, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, 0, 3)])
         ]).run(sender=user1)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == editions - 3)
-    scenario.verify(fa2.get_balance(sp.record(owner=user3.address, token_id=0)) == 3)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user1.address, 0)) == editions - 3)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user3.address, 0)) == 3)
     scenario.verify(fa2.total_supply(0) == editions)
 
     # Check that the owner cannot transfer more tokens than the ones they have
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user2.address, token_id=0, amount=30)])
+            txs=[fa2TestUtils.transfer_tx(user2.address, 0, 30)])
         ]).run(valid=False, sender=user1)
 
     # Check that an owner cannot transfer other owners editions
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=0, amount=1)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, 0, 1)])
         ]).run(valid=False, sender=user3)
 
     # Check that the new owner can transfer their own editions
     fa2.transfer([
         sp.record(
             from_=user3.address,
-            txs=[sp.record(to_=user2.address, token_id=0, amount=1)])
+            txs=[fa2TestUtils.transfer_tx(user2.address, 0, 1)])
         ]).run(sender=user3)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == editions - 3)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=0)) == 1)
-    scenario.verify(fa2.get_balance(sp.record(owner=user3.address, token_id=0)) == 3 - 1)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user1.address, 0)) == editions - 3)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user2.address, 0)) == 1)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user3.address, 0)) == 3 - 1)
     scenario.verify(fa2.total_supply(0) == editions)
 
     # Make the second user as operator of the first user token
@@ -258,13 +309,13 @@ def test_transfer():
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=0, amount=5)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, 0, 5)])
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == editions - 3 - 5)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=0)) == 1)
-    scenario.verify(fa2.get_balance(sp.record(owner=user3.address, token_id=0)) == 3 - 1 + 5)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user1.address, 0)) == editions - 3 - 5)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user2.address, 0)) == 1)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user3.address, 0)) == 3 - 1 + 5)
     scenario.verify(fa2.total_supply(0) == editions)
 
 
@@ -280,26 +331,12 @@ def test_complex_transfer():
     fa2 = testEnvironment["fa2"]
 
     # Mint two tokens
-    fa2.mint(
-        amount=10,
-        metadata={"": sp.utils.bytes_of_string("ipfs://aaa")},
-        data={},
-        royalties=sp.record(
-            minter=sp.record(address=user1.address, royalties=0),
-            creator=sp.record(address=user1.address, royalties=100))
-        ).run(sender=admin)
-    fa2.mint(
-        amount=20,
-        metadata={"": sp.utils.bytes_of_string("ipfs://bbb")},
-        data={},
-        royalties=sp.record(
-            minter=sp.record(address=user2.address, royalties=0),
-            creator=sp.record(address=user2.address, royalties=100))
-        ).run(sender=admin)
+    mint_two_tokens(fa2, admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == 10)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=1)) == 20)
+    check_balances(scenario, fa2, [
+        (user1.address, 0, 10),
+        (user2.address, 1, 20)])
     scenario.verify(fa2.total_supply(0) == 10)
     scenario.verify(fa2.total_supply(1) == 20)
 
@@ -307,10 +344,10 @@ def test_complex_transfer():
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=0, amount=3)]),
+            txs=[fa2TestUtils.transfer_tx(user3.address, 0, 3)]),
         sp.record(
             from_=user2.address,
-            txs=[sp.record(to_=user3.address, token_id=1, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, 1, 3)])
         ]).run(valid=False, sender=user1)
 
     # Check that the owner can transfer the token to several users
@@ -318,24 +355,25 @@ def test_complex_transfer():
         sp.record(
             from_=user1.address,
             txs=[
-                sp.record(to_=user2.address, token_id=0, amount=2),
-                sp.record(to_=user3.address, token_id=0, amount=3)])
+                fa2TestUtils.transfer_tx(user2.address, 0, 2),
+                fa2TestUtils.transfer_tx(user3.address, 0, 3)])
         ]).run(sender=user1)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == 10 - 2 - 3)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=0)) == 2)
-    scenario.verify(fa2.get_balance(sp.record(owner=user3.address, token_id=0)) == 3)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=1)) == 20)
+    check_balances(scenario, fa2, [
+        (user1.address, 0, 10 - 2 - 3),
+        (user2.address, 0, 2),
+        (user3.address, 0, 3),
+        (user2.address, 1, 20)])
 
     # Check that the admin cannot transfer whatever token they want
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=0, amount=1)]),
+            txs=[fa2TestUtils.transfer_tx(user3.address, 0, 1)]),
         sp.record(
             from_=user2.address,
-            txs=[sp.record(to_=user3.address, token_id=1, amount=5)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, 1, 5)])
         ]).run(valid=False, sender=admin)
 
     # Check that owners can transfer tokens to themselves
@@ -343,16 +381,17 @@ def test_complex_transfer():
         sp.record(
             from_=user2.address,
             txs=[
-                sp.record(to_=user2.address, token_id=0, amount=1),
-                sp.record(to_=user2.address, token_id=0, amount=0),
-                sp.record(to_=user2.address, token_id=1, amount=2)])
+                fa2TestUtils.transfer_tx(user2.address, 0, 1),
+                fa2TestUtils.transfer_tx(user2.address, 0, 0),
+                fa2TestUtils.transfer_tx(user2.address, 1, 2)])
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == 10 - 2 - 3)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=0)) == 2)
-    scenario.verify(fa2.get_balance(sp.record(owner=user3.address, token_id=0)) == 3)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=1)) == 20)
+    check_balances(scenario, fa2, [
+        (user1.address, 0, 10 - 2 - 3),
+        (user2.address, 0, 2),
+        (user3.address, 0, 3),
+        (user2.address, 1, 20)])
 
     # Make the second user as operator of the first user token
     fa2.update_operators([sp.variant("add_operator", sp.record(
@@ -364,18 +403,19 @@ def test_complex_transfer():
     fa2.transfer([
         sp.record(
             from_=user2.address,
-            txs=[sp.record(to_=user3.address, token_id=1, amount=1)]),
+            txs=[fa2TestUtils.transfer_tx(user3.address, 1, 1)]),
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=0, amount=2)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, 0, 2)])
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == 10 - 2 - 3 - 2)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=0)) == 2)
-    scenario.verify(fa2.get_balance(sp.record(owner=user3.address, token_id=0)) == 3 + 2)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=1)) == 20 - 1)
-    scenario.verify(fa2.get_balance(sp.record(owner=user3.address, token_id=1)) == 1)
+    check_balances(scenario, fa2, [
+        (user1.address, 0, 10 - 2 - 3 - 2),
+        (user2.address, 0, 2),
+        (user3.address, 0, 3 + 2),
+        (user2.address, 1, 20 - 1),
+        (user3.address, 1, 1)])
 
 
 @sp.add_test(name="Test balance of")
@@ -395,57 +435,40 @@ def test_balance_of():
 
     # Get the contract handler to the receive_balances entry point
     c = sp.contract(
-            t=sp.TList(sp.TRecord(
-                request=sp.TRecord(owner=sp.TAddress, token_id=sp.TNat).layout(("owner", "token_id")),
-                balance=sp.TNat).layout(("request", "balance"))),
+            t=fa2TestUtils.BALANCE_CALLBACK_TYPE,
             address=dummyContract.address,
             entry_point="receive_balances").open_some()
 
     # Mint two tokens
-    fa2.mint(
-        amount=10,
-        metadata={"": sp.utils.bytes_of_string("ipfs://aaa")},
-        data={},
-        royalties=sp.record(
-            minter=sp.record(address=user1.address, royalties=0),
-            creator=sp.record(address=user1.address, royalties=100))
-        ).run(sender=admin)
-    fa2.mint(
-        amount=20,
-        metadata={"": sp.utils.bytes_of_string("ipfs://bbb")},
-        data={},
-        royalties=sp.record(
-            minter=sp.record(address=user2.address, royalties=0),
-            creator=sp.record(address=user2.address, royalties=100))
-        ).run(sender=admin)
+    mint_two_tokens(fa2, admin)
 
-    # Check the balances using the on-chain view
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == 10)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=1)) == 20)
+    # Check the balances using the on-chain view. It shouldn't fail if there
+    # is no row for that information in the ledger
+    check_balances(scenario, fa2, [
+        (user1.address, 0, 10),
+        (user2.address, 1, 20),
+        (user2.address, 0, 0),
+        (user3.address, 0, 0),
+        (user1.address, 1, 0),
+        (user3.address, 1, 0)])
 
-    # Check that it doesn't fail if there is not row for that information in the ledger
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=0)) == 0)
-    scenario.verify(fa2.get_balance(sp.record(owner=user3.address, token_id=0)) == 0)
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=1)) == 0)
-    scenario.verify(fa2.get_balance(sp.record(owner=user3.address, token_id=1)) == 0)
-
-    # Check that it fails if the token doesn't exist
-    scenario.verify(sp.is_failing(fa2.get_balance(sp.record(owner=user1.address, token_id=10))))
+    # Check that the on-chain view fails if the token doesn't exist
+    scenario.verify(sp.is_failing(fa2.get_balance(fa2TestUtils.balance_request(user1.address, 10))))
 
     # Check that asking for the token balances fails if the token doesn't exist
     fa2.balance_of(sp.record(
-        requests=[sp.record(owner=user1.address, token_id=10)],
+        requests=[fa2TestUtils.balance_request(user1.address, 10)],
         callback=c)).run(valid=False, sender=user3)
 
     # Ask for the token balances
     fa2.balance_of(sp.record(
         requests=[
-            sp.record(owner=user1.address, token_id=0),
-            sp.record(owner=user2.address, token_id=0),
-            sp.record(owner=user3.address, token_id=0),
-            sp.record(owner=user1.address, token_id=1),
-            sp.record(owner=user2.address, token_id=1),
-            sp.record(owner=user3.address, token_id=1)],
+            fa2TestUtils.balance_request(user1.address, 0),
+            fa2TestUtils.balance_request(user2.address, 0),
+            fa2TestUtils.balance_request(user3.address, 0),
+            fa2TestUtils.balance_request(user1.address, 1),
+            fa2TestUtils.balance_request(user2.address, 1),
+            fa2TestUtils.balance_request(user3.address, 1)],
         callback=c)).run(sender=user3)
 
     # Check that the returned balances are correct
@@ -469,28 +492,12 @@ def test_update_operators():
     fa2 = testEnvironment["fa2"]
 
     # Mint two tokens
-    fa2.mint(
-        amount=10,
-        metadata={"": sp.utils.bytes_of_string("ipfs://aaa")},
-        data={},
-        royalties=sp.record(
-            minter=sp.record(address=user1.address, royalties=0),
-            creator=sp.record(address=user1.address, royalties=100))
-        ).run(sender=admin)
-    fa2.mint(
-        amount=20,
-        metadata={"": sp.utils.bytes_of_string("ipfs://bbb")},
-        data={},
-        royalties=sp.record(
-            minter=sp.record(address=user2.address, royalties=0),
-            creator=sp.record(address=user2.address, royalties=100))
-        ).run(sender=admin)
+    mint_two_tokens(fa2, admin)
 
     # Check that the operators information is empty
-    scenario.verify(~fa2.is_operator(
-        sp.record(owner=user1.address, operator=user2.address, token_id=0)))
-    scenario.verify(~fa2.is_operator(
-        sp.record(owner=user2.address, operator=user1.address, token_id=1)))
+    check_operators(scenario, fa2, [
+        (user1.address, user2.address, 0, False),
+        (user2.address, user1.address, 1, False)])
 
     # Check that is not possible to change the operators if one is not the owner
     fa2.update_operators([
@@ -529,12 +536,10 @@ def test_update_operators():
         ]).run(sender=user1)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.is_operator(
-        sp.record(owner=user1.address, operator=user3.address, token_id=0)))
-    scenario.verify(fa2.is_operator(
-        sp.record(owner=user1.address, operator=user2.address, token_id=1)))
-    scenario.verify(fa2.is_operator(
-        sp.record(owner=user1.address, operator=user3.address, token_id=1)))
+    check_operators(scenario, fa2, [
+        (user1.address, user3.address, 0, True),
+        (user1.address, user2.address, 1, True),
+        (user1.address, user3.address, 1, True)])
 
     # Check that adding and removing operators works at the same time
     fa2.update_operators([
@@ -553,12 +558,10 @@ def test_update_operators():
         ]).run(sender=user1)
 
     # Check that the contract information has been updated
-    scenario.verify(~fa2.is_operator(
-        sp.record(owner=user1.address, operator=user3.address, token_id=0)))
-    scenario.verify(fa2.is_operator(
-        sp.record(owner=user1.address, operator=user2.address, token_id=1)))
-    scenario.verify(~fa2.is_operator(
-        sp.record(owner=user1.address, operator=user3.address, token_id=1)))
+    check_operators(scenario, fa2, [
+        (user1.address, user3.address, 0, False),
+        (user1.address, user2.address, 1, True),
+        (user1.address, user3.address, 1, False)])
 
     # Check that removing an operator that doesn't exist works
     scenario.verify(~fa2.is_operator(
@@ -4,9 +4,22 @@
 
 import smartpy as sp
 
-# Import the fa2Contract module
+# Import the fa2Contract and fa2TestUtils modules
 fa2Contract = sp.io.import_script_from_url(
     "file:python/contracts/fa2Contract.py")
+fa2TestUtils = sp.io.import_script_from_url(
+    "file:python/tests/fa2TestUtils.py")
+
+# Create the test accounts
+ADMIN = sp.test_account("admin")
+USER1 = sp.test_account("user1")
+USER2 = sp.test_account("user2")
+USER3 = sp.test_account("user3")
+
+# Define the packed token metadata links that are used in several tests
+IPFS_AAA = sp.pack("ipfs://aaa")
+IPFS_BBB = sp.pack("ipfs://bbb")
+IPFS_FFF = sp.pack("ipfs://fff")
 
 
 class DummyContract(sp.Contract):
@@ -32,9 +45,7 @@ class DummyContract(sp.Contract):
 
         """
         # Define the input parameter data type
-        sp.set_type(params, sp.TList(sp.TRecord(
-                request=sp.TRecord(owner=sp.TAddress, token_id=sp.TNat).layout(("owner", "token_id")),
-                balance=sp.TNat).layout(("request", "balance"))))
+        sp.set_type(params, fa2TestUtils.BALANCE_CALLBACK_TYPE)
 
         # Save the returned information in the balances big map
         with sp.for_("balance_info", params) as balance_info:
@@ -44,15 +55,9 @@ class DummyContract(sp.Contract):
 
 
 def get_test_environment():
-    # Create the test accounts
-    admin = sp.test_account("admin")
-    user1 = sp.test_account("user1")
-    user2 = sp.test_account("user2")
-    user3 = sp.test_account("user3")
-
     # Initialize the FA2 contract
     fa2 = fa2Contract.FA2(
-        administrator=admin.address,
+        administrator=ADMIN.address,
         metadata=sp.utils.metadata_of_url("ipfs://aaa"))
 
     # Add the contract to the test scenario
@@ -62,15 +67,37 @@ def get_test_environment():
     # Save all the variables in a test environment dictionary
     testEnvironment = {
         "scenario" : scenario,
-        "admin" : admin,
-        "user1" : user1,
-        "user2" : user2,
-        "user3" : user3,
+        "admin" : ADMIN,
+        "user1" : USER1,
+        "user2" : USER2,
+        "user3" : USER3,
         "fa2" : fa2}
 
     return testEnvironment
 
 
+def check_only_admin(entry_point, params, admin, user):
+    """Checks that only the admin can execute the given entry point.
+
+    """
+    # Check that a normal user cannot execute the entry point
+    entry_point(params).run(valid=False, sender=user)
+
+    # Check that the admin can execute the entry point
+    entry_point(params).run(sender=admin)
+
+
+def check_balances(scenario, fa2, balances):
+    """Checks a list of (owner, token_id, balance) token balances against
+    the balance field of the FA2 ledger entries, one scenario verification
+    per balance.
+
+    """
+    for owner, token_id, balance in balances:
+        scenario.verify(
+            fa2.data.ledger[(owner, token_id)].balance == balance)
+
+
 @sp.add_test(name="Test mint")
 def test_mint():
     # Get the test environment
@@ -81,23 +108,16 @@ def test_mint():
     user2 = testEnvironment["user2"]
     fa2 = testEnvironment["fa2"]
 
-    # Check that a normal user cannot mint
+    # Check that only the admin can mint
     address = user1.address
     editions = 5
-    metadata = {"": sp.pack("ipfs://fff")}
+    metadata = {"": IPFS_FFF}
     token_id = 0
-    fa2.mint(
+    check_only_admin(fa2.mint, sp.record(
         address=address,
         amount=editions,
         metadata=metadata,
-        token_id=token_id).run(valid=False, sender=user1)
-
-    # Check that the admin can mint
-    fa2.mint(
-        address=address,
-        amount=editions,
-        metadata=metadata,
-        token_id=token_id).run(sender=admin)
+        token_id=token_id), admin, user1)
 
     # Check that the contract information has been updated
     scenario.verify(fa2.data.ledger[(address, token_id)].balance == editions)
@@ -142,8 +162,9 @@ def test_mint():
         token_id=token_id).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(address, token_id)].balance == 2 * editions)
-    scenario.verify(fa2.data.ledger[(new_address, token_id)].balance == editions)
+    check_balances(scenario, fa2, [
+        (address, token_id, 2 * editions),
+        (new_address, token_id, editions)])
     scenario.verify(fa2.data.total_supply[token_id] == 3 * editions)
     scenario.verify(fa2.data.token_metadata[token_id].token_info[""] == metadata[""])
     scenario.verify(fa2.data.all_tokens == token_id + 1)
@@ -160,8 +181,9 @@ def test_mint():
         token_id=token_id).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(address, token_id)].balance == 2 * editions)
-    scenario.verify(fa2.data.ledger[(new_address, token_id)].balance == editions)
+    check_balances(scenario, fa2, [
+        (address, token_id, 2 * editions),
+        (new_address, token_id, editions)])
     scenario.verify(fa2.data.total_supply[token_id] == 3 * editions)
     scenario.verify(sp.len(fa2.all_tokens()) == 1)
     scenario.verify(fa2.total_supply(token_id) == 3 * editions)
@@ -183,9 +205,10 @@ def test_mint():
         token_id=new_token_id).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(address, token_id)].balance == 2 * editions)
-    scenario.verify(fa2.data.ledger[(new_address, token_id)].balance == editions)
-    scenario.verify(fa2.data.ledger[(new_address, new_token_id)].balance == new_editions)
+    check_balances(scenario, fa2, [
+        (address, token_id, 2 * editions),
+        (new_address, token_id, editions),
+        (new_address, new_token_id, new_editions)])
     scenario.verify(fa2.data.total_supply[token_id] == 3 * editions)
     scenario.verify(fa2.data.total_supply[new_token_id] == new_editions)
     scenario.verify(fa2.data.token_metadata[token_id].token_id == token_id)
@@ -213,7 +236,7 @@ def test_transfer():
 
     # Mint a token
     editions = 15
-    metadata = {"": sp.pack("ipfs://fff")}
+    metadata = {"": IPFS_FFF}
     token_id = 0
     fa2.mint(
         address=user1.address,
@@ -231,19 +254,20 @@ def test_transfer():
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=token_id, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, token_id, 3)])
         ]).run(valid=False, sender=user2)
 
     # Check that the owner can transfer the token
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=token_id, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, token_id, 3)])
         ]).run(sender=user1)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, token_id)].balance == editions - 3)
-    scenario.verify(fa2.data.ledger[(user3.address, token_id)].balance == 3)
+    check_balances(scenario, fa2, [
+        (user1.address, token_id, editions - 3),
+        (user3.address, token_id, 3)])
     scenario.verify(fa2.data.total_supply[token_id] == editions)
     scenario.verify(fa2.total_supply(token_id) == editions)
 
@@ -251,13 +275,14 @@ def test_transfer():
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user2.address, token_id=token_id, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user2.address, token_id, 3)])
         ]).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, token_id)].balance == editions - 6)
-    scenario.verify(fa2.data.ledger[(user2.address, token_id)].balance == 3)
-    scenario.verify(fa2.data.ledger[(user3.address, token_id)].balance == 3)
+    check_balances(scenario, fa2, [
+        (user1.address, token_id, editions - 6),
+        (user2.address, token_id, 3),
+        (user3.address, token_id, 3)])
     scenario.verify(fa2.data.total_supply[token_id] == editions)
     scenario.verify(fa2.total_supply(token_id) == editions)
 
@@ -265,32 +290,33 @@ def test_transfer():
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user2.address, token_id=token_id, amount=30)])
+            txs=[fa2TestUtils.transfer_tx(user2.address, token_id, 30)])
         ]).run(valid=False, sender=admin)
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user2.address, token_id=token_id, amount=30)])
+            txs=[fa2TestUtils.transfer_tx(user2.address, token_id, 30)])
         ]).run(valid=False, sender=user1)
 
     # Check that an owner cannot transfer other owners editions
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=token_id, amount=1)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, token_id, 1)])
         ]).run(valid=False, sender=user2)
 
     # Check that the owner can transfer their own editions
     fa2.transfer([
         sp.record(
             from_=user2.address,
-            txs=[sp.record(to_=user3.address, token_id=token_id, amount=1)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, token_id, 1)])
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, token_id)].balance == editions - 6)
-    scenario.verify(fa2.data.ledger[(user2.address, token_id)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, token_id)].balance == 4)
+    check_balances(scenario, fa2, [
+        (user1.address, token_id, editions - 6),
+        (user2.address, token_id, 2),
+        (user3.address, token_id, 4)])
     scenario.verify(fa2.data.total_supply[token_id] == editions)
     scenario.verify(fa2.total_supply(token_id) == editions)
 
@@ -304,13 +330,14 @@ def test_transfer():
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=token_id, amount=5)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, token_id, 5)])
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, token_id)].balance == editions - 6 - 5)
-    scenario.verify(fa2.data.ledger[(user2.address, token_id)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, token_id)].balance == 4 + 5)
+    check_balances(scenario, fa2, [
+        (user1.address, token_id, editions - 6 - 5),
+        (user2.address, token_id, 2),
+        (user3.address, token_id, 4 + 5)])
     scenario.verify(fa2.data.total_supply[token_id] == editions)
     scenario.verify(fa2.total_supply(token_id) == editions)
 
@@ -330,17 +357,18 @@ def test_complex_transfer():
     fa2.mint(
         address=user1.address,
         amount=10,
-        metadata={"": sp.pack("ipfs://aaa")},
+        metadata={"": IPFS_AAA},
         token_id=0).run(sender=admin)
     fa2.mint(
         address=user2.address,
         amount=20,
-        metadata={"": sp.pack("ipfs://bbb")},
+        metadata={"": IPFS_BBB},
         token_id=1).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 10)
-    scenario.verify(fa2.data.ledger[(user2.address, 1)].balance == 20)
+    check_balances(scenario, fa2, [
+        (user1.address, 0, 10),
+        (user2.address, 1, 20)])
     scenario.verify(fa2.data.total_supply[0] == 10)
     scenario.verify(fa2.data.total_supply[1] == 20)
 
@@ -348,10 +376,10 @@ def test_complex_transfer():
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=0, amount=3)]),
+            txs=[fa2TestUtils.transfer_tx(user3.address, 0, 3)]),
         sp.record(
             from_=user2.address,
-            txs=[sp.record(to_=user3.address, token_id=1, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, 1, 3)])
         ]).run(valid=False, sender=user1)
 
     # Check that the owner can transfer the token to several users
@@ -359,49 +387,52 @@ def test_complex_transfer():
         sp.record(
             from_=user1.address,
             txs=[
-                sp.record(to_=user2.address, token_id=0, amount=2),
-                sp.record(to_=user3.address, token_id=0, amount=3)])
+                fa2TestUtils.transfer_tx(user2.address, 0, 2),
+                fa2TestUtils.transfer_tx(user3.address, 0, 3)])
         ]).run(sender=user1)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 10 - 2 - 3)
-    scenario.verify(fa2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, 0)].balance == 3)
-    scenario.verify(fa2.data.ledger[(user2.address, 1)].balance == 20)
+    check_balances(scenario, fa2, [
+        (user1.address, 0, 10 - 2 - 3),
+        (user2.address, 0, 2),
+        (user3.address, 0, 3),
+        (user2.address, 1, 20)])
 
     # Check that the admin can transfer whatever token they want
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=0, amount=1)]),
+            txs=[fa2TestUtils.transfer_tx(user3.address, 0, 1)]),
         sp.record(
             from_=user2.address,
-            txs=[sp.record(to_=user3.address, token_id=1, amount=5)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, 1, 5)])
         ]).run(sender=admin)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 10 - 2 - 3 - 1)
-    scenario.verify(fa2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, 0)].balance == 4)
-    scenario.verify(fa2.data.ledger[(user2.address, 1)].balance == 20 - 5)
-    scenario.verify(fa2.data.ledger[(user3.address, 1)].balance == 5)
+    check_balances(scenario, fa2, [
+        (user1.address, 0, 10 - 2 - 3 - 1),
+        (user2.address, 0, 2),
+        (user3.address, 0, 4),
+        (user2.address, 1, 20 - 5),
+        (user3.address, 1, 5)])
 
     # Check that owners can transfer tokens to themselves
     fa2.transfer([
         sp.record(
             from_=user2.address,
             txs=[
-                sp.record(to_=user2.address, token_id=0, amount=1),
-                sp.record(to_=user2.address, token_id=0, amount=2),
-                sp.record(to_=user2.address, token_id=1, amount=2)])
+                fa2TestUtils.transfer_tx(user2.address, 0, 1),
+                fa2TestUtils.transfer_tx(user2.address, 0, 2),
+                fa2TestUtils.transfer_tx(user2.address, 1, 2)])
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 10 - 2 - 3 - 1)
-    scenario.verify(fa2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, 0)].balance == 4)
-    scenario.verify(fa2.data.ledger[(user2.address, 1)].balance == 20 - 5)
-    scenario.verify(fa2.data.ledger[(user3.address, 1)].balance == 5)
+    check_balances(scenario, fa2, [
+        (user1.address, 0, 10 - 2 - 3 - 1),
+        (user2.address, 0, 2),
+        (user3.address, 0, 4),
+        (user2.address, 1, 20 - 5),
+        (user3.address, 1, 5)])
 
     # Make the second user as operator of the first user token
     fa2.update_operators([sp.variant("add_operator", sp.record(
@@ -413,18 +444,19 @@ def test_complex_transfer():
     fa2.transfer([
         sp.record(
             from_=user2.address,
-            txs=[sp.record(to_=user3.address, token_id=1, amount=1)]),
+            txs=[fa2TestUtils.transfer_tx(user3.address, 1, 1)]),
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user3.address, token_id=0, amount=2)])
+            txs=[fa2TestUtils.transfer_tx(user3.address, 0, 2)])
         ]).run(sender=user2)
 
     # Check that the contract information has been updated
-    scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 10 - 2 - 3 - 1 - 2)
-    scenario.verify(fa2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2.data.ledger[(user3.address, 0)].balance == 4 + 2)
-    scenario.verify(fa2.data.ledger[(user2.address, 1)].balance == 20 - 5 - 1)
-    scenario.verify(fa2.data.ledger[(user3.address, 1)].balance == 5 + 1)
+    check_balances(scenario, fa2, [
+        (user1.address, 0, 10 - 2 - 3 - 1 - 2),
+        (user2.address, 0, 2),
+        (user3.address, 0, 4 + 2),
+        (user2.address, 1, 20 - 5 - 1),
+        (user3.address, 1, 5 + 1)])
 
 
 @sp.add_test(name="Test balance of")
@@ -444,9 +476,7 @@ def test_balance_of():
 
     # Get the contract handler to the receive_balances entry point
     c = sp.contract(
-            t=sp.TList(sp.TRecord(
-                request=sp.TRecord(owner=sp.TAddress, token_id=sp.TNat).layout(("owner", "token_id")),
-                balance=sp.TNat).layout(("request", "balance"))),
+            t=fa2TestUtils.BALANCE_CALLBACK_TYPE,
             address=dummyContract.address,
             entry_point="receive_balances").open_some()
 
@@ -454,12 +484,12 @@ def test_balance_of():
     fa2.mint(
         address=user1.address,
         amount=10,
-        metadata={"": sp.pack("ipfs://aaa")},
+        metadata={"": IPFS_AAA},
         token_id=0).run(sender=admin)
     fa2.mint(
         address=user2.address,
         amount=20,
-        metadata={"": sp.pack("ipfs://bbb")},
+        metadata={"": IPFS_BBB},
         token_id=1).run(sender=admin)
     fa2.mint(
         address=user3.address,
@@ -468,30 +498,30 @@ def test_balance_of():
         token_id=1).run(sender=admin)
 
     # Check the balances using the off-chain view
-    scenario.verify(fa2.get_balance(sp.record(owner=user1.address, token_id=0)) == 10)
-    scenario.verify(fa2.get_balance(sp.record(owner=user2.address, token_id=1)) == 20)
-    scenario.verify(fa2.get_balance(sp.record(owner=user3.address, token_id=1)) == 5)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user1.address, 0)) == 10)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user2.address, 1)) == 20)
+    scenario.verify(fa2.get_balance(fa2TestUtils.balance_request(user3.address, 1)) == 5)
 
     # Check that it fails if there is not row for that information in the ledger
-    scenario.verify(sp.is_failing(fa2.get_balance(sp.record(owner=user2.address, token_id=0))))
-    scenario.verify(sp.is_failing(fa2.get_balance(sp.record(owner=user3.address, token_id=0))))
-    scenario.verify(sp.is_failing(fa2.get_balance(sp.record(owner=user1.address, token_id=1))))
-    scenario.verify(sp.is_failing(fa2.get_balance(sp.record(owner=user1.address, token_id=10))))
+    scenario.verify(sp.is_failing(fa2.get_balance(fa2TestUtils.balance_request(user2.address, 0))))
+    scenario.verify(sp.is_failing(fa2.get_balance(fa2TestUtils.balance_request(user3.address, 0))))
+    scenario.verify(sp.is_failing(fa2.get_balance(fa2TestUtils.balance_request(user1.address, 1))))
+    scenario.verify(sp.is_failing(fa2.get_balance(fa2TestUtils.balance_request(user1.address, 10))))
 
     # Check that asking for the token balances fails if the token doesn't exist
     fa2.balance_of(sp.record(
-        requests=[sp.record(owner=user1.address, token_id=10)],
+        requests=[fa2TestUtils.balance_request(user1.address, 10)],
         callback=c)).run(valid=False, sender=user3)
 
     # Ask for the token balances
     fa2.balance_of(sp.record(
         requests=[
-            sp.record(owner=user1.address, token_id=0),
-            sp.record(owner=user2.address, token_id=0),
-            sp.record(owner=user3.address, token_id=0),
-            sp.record(owner=user1.address, token_id=1),
-            sp.record(owner=user2.address, token_id=1),
-            sp.record(owner=user3.address, token_id=1)],
+            fa2TestUtils.balance_request(user1.address, 0),
+            fa2TestUtils.balance_request(user2.address, 0),
+            fa2TestUtils.balance_request(user3.address, 0),
+            fa2TestUtils.balance_request(user1.address, 1),
+            fa2TestUtils.balance_request(user2.address, 1),
+            fa2TestUtils.balance_request(user3.address, 1)],
         callback=c)).run(sender=user3)
 
     # Check that the returned balances are correct
@@ -508,12 +538,12 @@ def test_balance_of():
     # Ceck that now asking for the token balances fails
     fa2.balance_of(sp.record(
         requests=[
-            sp.record(owner=user1.address, token_id=0),
-            sp.record(owner=user2.address, token_id=0),
-            sp.record(owner=user3.address, token_id=0),
-            sp.record(owner=user1.address, token_id=1),
-            sp.record(owner=user2.address, token_id=1),
-            sp.record(owner=user3.address, token_id=1)],
+            fa2TestUtils.balance_request(user1.address, 0),
+            fa2TestUtils.balance_request(user2.address, 0),
+            fa2TestUtils.balance_request(user3.address, 0),
+            fa2TestUtils.balance_request(user1.address, 1),
+            fa2TestUtils.balance_request(user2.address, 1),
+            fa2TestUtils.balance_request(user3.address, 1)],
         callback=c)).run(valid=False, sender=user3)
 
 
@@ -532,12 +562,12 @@ def test_update_operators():
     fa2.mint(
         address=user1.address,
         amount=10,
-        metadata={"": sp.pack("ipfs://aaa")},
+        metadata={"": IPFS_AAA},
         token_id=0).run(sender=admin)
     fa2.mint(
         address=user2.address,
         amount=20,
-        metadata={"": sp.pack("ipfs://bbb")},
+        metadata={"": IPFS_BBB},
         token_id=1).run(sender=admin)
 
     # Check that the operators information is empty
@@ -676,8 +706,7 @@ def test_set_administrator():
 
     # Check that only the admin can set the new administrator
     new_administrator = user1.address
-    fa2.set_administrator(new_administrator).run(valid=False, sender=user1)
-    fa2.set_administrator(new_administrator).run(sender=admin)
+    check_only_admin(fa2.set_administrator, new_administrator, admin, user1)
 
     # Check that the administrator has been updated
     scenario.verify(fa2.data.administrator == new_administrator)
@@ -694,8 +723,7 @@ def test_set_metadata():
 
     # Check that only the admin can update the metadata
     new_metadata = sp.record(k="", v=sp.pack("ipfs://zzzz"))
-    fa2.set_metadata(new_metadata).run(valid=False, sender=user1)
-    fa2.set_metadata(new_metadata).run(sender=admin)
+    check_only_admin(fa2.set_metadata, new_metadata, admin, user1)
 
     # Check that the metadata is updated
     scenario.verify(fa2.data.metadata[new_metadata.k] == new_metadata.v)
@@ -723,21 +751,18 @@ def test_set_pause():
     fa2.mint(
         address=user1.address,
         amount=10,
-        metadata={"": sp.pack("ipfs://aaa")},
+        metadata={"": IPFS_AAA},
         token_id=0).run(sender=admin)
 
     # Check that the owner can transfer the token
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user2.address, token_id=0, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user2.address, 0, 3)])
         ]).run(sender=user1)
 
-    # Check that the user cannot pause the contract
-    fa2.set_pause(True).run(valid=False, sender=user1)
-
-    # Pause the contract
-    fa2.set_pause(True).run(sender=admin)
+    # Check that only the admin can pause the contract
+    check_only_admin(fa2.set_pause, True, admin, user1)
 
     # Check that the contract information has been updated
     scenario.verify(fa2.data.paused)
@@ -746,14 +771,14 @@ def test_set_pause():
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user2.address, token_id=0, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user2.address, 0, 3)])
         ]).run(valid=False, sender=user1)
 
     # Check that it's still possible to mint
     fa2.mint(
         address=user1.address,
         amount=10,
-        metadata={"": sp.pack("ipfs://bbb")},
+        metadata={"": IPFS_BBB},
         token_id=1).run(sender=admin)
 
     # Unpause the contract
@@ -763,5 +788,5 @@ def test_set_pause():
     fa2.transfer([
         sp.record(
             from_=user1.address,
-            txs=[sp.record(to_=user2.address, token_id=0, amount=3)])
+            txs=[fa2TestUtils.transfer_tx(user2.address, 0, 3)])
         ]).run(sender=user1)
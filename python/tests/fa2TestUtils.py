@@ -0,0 +1,24 @@
+"""Helper functions and types shared by the FA2 related unit tests.
+
+"""
+
+import smartpy as sp
+
+# Define the balance_of callback parameter data type
+BALANCE_CALLBACK_TYPE = sp.TList(sp.TRecord(
+    request=sp.TRecord(owner=sp.TAddress, token_id=sp.TNat).layout(("owner", "token_id")),
+    balance=sp.TNat).layout(("request", "balance")))
+
+
+def balance_request(owner, token_id):
+    """Returns a token balance request record.
+
+    """
+    return sp.record(owner=owner, token_id=token_id)
+
+
+def transfer_tx(to_, token_id, amount):
+    """Returns a token transfer transaction record.
+
+    """
+    return sp.record(to_=to_, token_id=token_id, amount=amount)
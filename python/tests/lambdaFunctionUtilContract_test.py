@@ -8,6 +8,9 @@ import smartpy as sp
 lambdaFunctionUtilContract = sp.io.import_script_from_url(
     "file:python/contracts/lambdaFunctionUtilContract.py")
 
+# Define the test account
+USER = sp.test_account("user")
+
 
 class DummyContract(sp.Contract):
     """This is a dummy contract to be used only for test purposes.
@@ -37,9 +40,6 @@ class DummyContract(sp.Contract):
 
 @sp.add_test(name="Test lambda function")
 def test_lambda_function():
-    # Create the test account
-    user = sp.test_account("user")
-
     # Initialize the dummy contract and the lambda function util contract
     dummyContract = DummyContract()
     lambdaFunctionUtil = lambdaFunctionUtilContract.LambdaFunctionUtilContract()
@@ -56,7 +56,7 @@ def test_lambda_function():
         sp.result([sp.transfer_operation(sp.nat(2), sp.mutez(0), contractHandle)])
 
     # Update and execute the lambda function
-    lambdaFunctionUtil.update_and_execute_lambda(lambda_function).run(sender=user)
+    lambdaFunctionUtil.update_and_execute_lambda(lambda_function).run(sender=USER)
 
     # Check that the dummy contract storage has been updated to the correct vale
     scenario.verify(dummyContract.data.x == 2)
@@ -8,21 +8,53 @@ import smartpy as sp
 managerContract = sp.io.import_script_from_url(
     "file:python/contracts/managerContract.py")
 
+# Define the test accounts
+USER = sp.test_account("user")
+USER_1 = sp.test_account("user_1")
+USER_2 = sp.test_account("user_2")
+USER_3 = sp.test_account("user_3")
+
+
+def get_test_environment():
+    # Initialize the contract
+    c = managerContract.ManagerContract(USER_1.address)
+
+    # Add the contract to the test scenario
+    scenario = sp.test_scenario()
+    scenario += c
+
+    # Save all the variables in a test environment dictionary
+    testEnvironment = {
+        "scenario" : scenario,
+        "user_1" : USER_1,
+        "user_2" : USER_2,
+        "user_3" : USER_3,
+        "c" : c}
+
+    return testEnvironment
+
+
+def check_rescue_accounts(scenario, c, rescue_accounts):
+    """Checks that the contract rescue accounts are exactly the given ones.
+
+    """
+    scenario.verify(sp.len(c.data.rescue_accounts) == len(rescue_accounts))
+
+    for rescue_account in rescue_accounts:
+        scenario.verify(c.data.rescue_accounts.contains(rescue_account))
+
 
 @sp.add_test(name="Test default initialization")
 def test_default_initialization():
-    # Define the test account
-    user = sp.test_account("user")
-
     # Initialize the contract
-    c = managerContract.ManagerContract(user.address)
+    c = managerContract.ManagerContract(USER.address)
 
     # Add the contract to the test scenario
     scenario = sp.test_scenario()
     scenario += c
 
     # Check that the information in the contract strorage is correct
-    scenario.verify(c.data.manager == user.address)
+    scenario.verify(c.data.manager == USER.address)
     scenario.verify(c.data.rescue_time == managerContract.DEFAULT_RESCUE_TIME)
     scenario.verify(sp.len(c.data.rescue_accounts) == 0)
     scenario.verify(
@@ -31,12 +63,9 @@ def test_default_initialization():
 
 @sp.add_test(name="Test initialization with rescue time")
 def test_initialization_with_rescue_time():
-    # Define the test account
-    user = sp.test_account("user")
-
     # Initialize the contract
     rescue_time = 1000
-    c = managerContract.ManagerContract(user.address, rescue_time)
+    c = managerContract.ManagerContract(USER.address, rescue_time)
 
     # Add the contract to the test scenario
     scenario = sp.test_scenario()
@@ -48,16 +77,12 @@ def test_initialization_with_rescue_time():
 
 @sp.add_test(name="Test ping")
 def test_ping():
-    # Define the test accounts
-    user_1 = sp.test_account("user_1")
-    user_2 = sp.test_account("user_2")
-
-    # Initialize the contract
-    c = managerContract.ManagerContract(user_1.address)
-
-    # Add the contract to the test scenario
-    scenario = sp.test_scenario()
-    scenario += c
+    # Get the test environment
+    testEnvironment = get_test_environment()
+    scenario = testEnvironment["scenario"]
+    user_1 = testEnvironment["user_1"]
+    user_2 = testEnvironment["user_2"]
+    c = testEnvironment["c"]
 
     # Ping the contract with the manager account
     c.ping().run(sender=user_1, now=sp.timestamp(1000))
@@ -69,16 +94,12 @@ def test_ping():
 
 @sp.add_test(name="Test update manager")
 def test_update_manager():
-    # Define the test accounts
-    user_1 = sp.test_account("user_1")
-    user_2 = sp.test_account("user_2")
-
-    # Initialize the contract
-    c = managerContract.ManagerContract(user_1.address)
-
-    # Add the contract to the test scenario
-    scenario = sp.test_scenario()
-    scenario += c
+    # Get the test environment
+    testEnvironment = get_test_environment()
+    scenario = testEnvironment["scenario"]
+    user_1 = testEnvironment["user_1"]
+    user_2 = testEnvironment["user_2"]
+    c = testEnvironment["c"]
 
     # Set user 2 as the new manager
     c.update_manager(user_2.address).run(sender=user_1)
@@ -90,70 +111,50 @@ def test_update_manager():
 
 
 @sp.add_test(name="Test update rescue accounts")
-def test_update_manager():
-    # Define the test accounts
-    user_1 = sp.test_account("user_1")
-    user_2 = sp.test_account("user_2")
-    user_3 = sp.test_account("user_3")
-
-    # Initialize the contract
-    c = managerContract.ManagerContract(user_1.address)
-
-    # Add the contract to the test scenario
-    scenario = sp.test_scenario()
-    scenario += c
+def test_update_rescue_accounts():
+    # Get the test environment
+    testEnvironment = get_test_environment()
+    scenario = testEnvironment["scenario"]
+    user_1 = testEnvironment["user_1"]
+    user_2 = testEnvironment["user_2"]
+    user_3 = testEnvironment["user_3"]
+    c = testEnvironment["c"]
 
     # Add user 2 to the rescue accounts
     c.add_rescue_account(user_2.address).run(sender=user_1)
-    scenario.verify(c.data.rescue_accounts.contains(user_2.address))
-    scenario.verify(sp.len(c.data.rescue_accounts) == 1)
+    check_rescue_accounts(scenario, c, [user_2.address])
 
     # Add user 3 to the rescue accounts
     c.add_rescue_account(user_3.address).run(sender=user_1)
-    scenario.verify(c.data.rescue_accounts.contains(user_2.address))
-    scenario.verify(c.data.rescue_accounts.contains(user_3.address))
-    scenario.verify(sp.len(c.data.rescue_accounts) == 2)
+    check_rescue_accounts(scenario, c, [user_2.address, user_3.address])
 
     # Add user 1 to the rescue accounts
     c.add_rescue_account(user_1.address).run(sender=user_1)
-    scenario.verify(c.data.rescue_accounts.contains(user_1.address))
-    scenario.verify(c.data.rescue_accounts.contains(user_2.address))
-    scenario.verify(c.data.rescue_accounts.contains(user_3.address))
-    scenario.verify(sp.len(c.data.rescue_accounts) == 3)
+    check_rescue_accounts(scenario, c, [user_1.address, user_2.address, user_3.address])
 
     # Remove user 2 from the rescue accounts
     c.remove_rescue_account(user_2.address).run(sender=user_1)
-    scenario.verify(c.data.rescue_accounts.contains(user_1.address))
-    scenario.verify(~c.data.rescue_accounts.contains(user_2.address))
-    scenario.verify(c.data.rescue_accounts.contains(user_3.address))
-    scenario.verify(sp.len(c.data.rescue_accounts) == 2)
+    check_rescue_accounts(scenario, c, [user_1.address, user_3.address])
 
     # Check that only the manager can add or remove rescue accounts
     c.add_rescue_account(user_2.address).run(valid=False, sender=user_3)
     c.remove_rescue_account(user_1.address).run(valid=False, sender=user_3)
-    scenario.verify(c.data.rescue_accounts.contains(user_1.address))
-    scenario.verify(c.data.rescue_accounts.contains(user_3.address))
-    scenario.verify(sp.len(c.data.rescue_accounts) == 2)
+    check_rescue_accounts(scenario, c, [user_1.address, user_3.address])
 
 
 @sp.add_test(name="Test rescue mode")
-def test_update_manager():
-    # Define the test accounts
-    user_1 = sp.test_account("user_1")
-    user_2 = sp.test_account("user_2")
-    user_3 = sp.test_account("user_3")
-
-    # Initialize the contract
-    c = managerContract.ManagerContract(user_1.address)
-
-    # Add the contract to the test scenario
-    scenario = sp.test_scenario()
-    scenario += c
+def test_rescue_mode():
+    # Get the test environment
+    testEnvironment = get_test_environment()
+    scenario = testEnvironment["scenario"]
+    user_1 = testEnvironment["user_1"]
+    user_2 = testEnvironment["user_2"]
+    user_3 = testEnvironment["user_3"]
+    c = testEnvironment["c"]
 
     # Add user 2 to the rescue accounts
     c.add_rescue_account(user_2.address).run(sender=user_1)
-    scenario.verify(c.data.rescue_accounts.contains(user_2.address))
-    scenario.verify(sp.len(c.data.rescue_accounts) == 1)
+    check_rescue_accounts(scenario, c, [user_2.address])
 
     # Ping the contract
     ping_time = sp.timestamp(1000)
@@ -5,13 +5,20 @@
 import os
 import smartpy as sp
 
-# Import the extendedFa2Contract, minterContract and marketplaceContract modules
+# Import the extendedFa2Contract, minterContract, marketplaceContract and
+# fa2TestUtils modules
 extendedFa2Contract = sp.io.import_script_from_url(
     "file:python/contracts/extendedFa2Contract.py")
 minterContract = sp.io.import_script_from_url(
     "file:python/contracts/minterContract.py")
 marketplaceContract = sp.io.import_script_from_url(
     "file:python/contracts/marketplaceContract.py")
+fa2TestUtils = sp.io.import_script_from_url(
+    "file:python/tests/fa2TestUtils.py")
+
+# Define the token metadata and the default swap price
+IPFS_FFF = sp.utils.bytes_of_string("ipfs://fff")
+PRICE = sp.mutez(1000000)
 
 
 class RecipientContract(sp.Contract):
@@ -93,6 +100,10 @@ def get_test_environment():
     # Change the marketplace fee recipient
     marketplace.update_fee_recipient(fee_recipient.address).run(sender=admin)
 
+    # Define the donations to the organizations used in the swaps
+    donations = [sp.record(address=org1.address, donation=100),
+                 sp.record(address=org2.address, donation=300)]
+
     # Save all the variables in a test environment dictionary
     testEnvironment = {
         "scenario": scenario,
@@ -106,11 +117,47 @@ def get_test_environment():
         "fa2": fa2,
         "minter": minter,
         "marketplace": marketplace,
-        "fee_recipient": fee_recipient}
+        "fee_recipient": fee_recipient,
+        "donations": donations}
 
     return testEnvironment
 
 
+def add_marketplace_operator(fa2, marketplace, owner, token_id):
+    """Adds the marketplace contract as an operator of the owner token
+    editions.
+
+    """
+    fa2.update_operators([sp.variant("add_operator", sp.record(
+        owner=owner.address,
+        operator=marketplace.address,
+        token_id=token_id))]).run(sender=owner.address)
+
+
+def mint_and_approve(fa2, minter, marketplace, artist, editions, royalties=100,
+                     token_id=0):
+    """Mints a token from the artist account and adds the marketplace contract
+    as an operator of the artist editions.
+
+    """
+    minter.mint(
+        editions=editions,
+        metadata={"": IPFS_FFF},
+        data={},
+        royalties=royalties).run(sender=artist.address)
+    add_marketplace_operator(fa2, marketplace, artist, token_id)
+
+
+def check_balances(scenario, fa2, balances):
+    """Checks a list of (owner, token_id, balance) token balances against
+    the extended FA2 ledger, which stores the number of editions directly,
+    one scenario verification per balance.
+
+    """
+    for owner, token_id, balance in balances:
+        scenario.verify(fa2.data.ledger[(owner, token_id)] == balance)
+
+
 @sp.add_test(name="Test swap and collect")
 def test_swap_and_collect():
     # Get the test environment
@@ -132,7 +179,7 @@ def test_swap_and_collect():
     royalties = 100
     minter.mint(
         editions=minted_editions,
-        metadata={"": sp.utils.bytes_of_string("ipfs://fff")},
+        metadata={"": IPFS_FFF},
         data={},
         royalties=royalties).run(sender=artist2.address)
 
@@ -141,15 +188,12 @@ def test_swap_and_collect():
     fa2.transfer([
         sp.record(
             from_=artist2.address,
-            txs=[sp.record(to_=artist1.address, token_id=0, amount=editions)])
+            txs=[fa2TestUtils.transfer_tx(artist1.address, 0, editions)])
         ]).run(sender=artist2.address)
 
     # Add the marketplace contract as an operator to be able to swap it
     token_id = 0
-    fa2.update_operators([sp.variant("add_operator", sp.record(
-        owner=artist1.address,
-        operator=marketplace.address,
-        token_id=token_id))]).run(sender=artist1.address)
+    add_marketplace_operator(fa2, marketplace, artist1, token_id)
 
     # Check that there are no swaps in the marketplace
     scenario.verify(~marketplace.data.swaps.contains(0))
@@ -159,76 +203,80 @@ def test_swap_and_collect():
 
     # Check that tez transfers are not allowed when swapping
     swapped_editions = 40
-    price = sp.mutez(1000000)
-    donations = [sp.record(address=org1.address, donation=100),
-                 sp.record(address=org2.address, donation=300)]
+    donations = testEnvironment["donations"]
     marketplace.swap(
         token_id=token_id,
         editions=swapped_editions,
-        price=price,
+        price=PRICE,
         donations=donations).run(valid=False, sender=artist1.address, amount=sp.tez(3))
 
     # Swap the token on the marketplace contract
     marketplace.swap(
         token_id=token_id,
         editions=swapped_editions,
-        price=price,
+        price=PRICE,
         donations=donations).run(sender=artist1.address)
 
     # Check that the token ledger information is correct
-    scenario.verify(fa2.data.ledger[(artist1.address, token_id)] == editions - swapped_editions)
-    scenario.verify(fa2.data.ledger[(artist2.address, token_id)] == minted_editions - editions)
-    scenario.verify(fa2.data.ledger[(marketplace.address, token_id)] == swapped_editions)
+    check_balances(scenario, fa2, [
+        (artist1.address, token_id, editions - swapped_editions),
+        (artist2.address, token_id, minted_editions - editions),
+        (marketplace.address, token_id, swapped_editions)])
 
     # Check that the swaps big map is correct
     scenario.verify(marketplace.data.swaps.contains(0))
     scenario.verify(marketplace.data.swaps[0].issuer == artist1.address)
     scenario.verify(marketplace.data.swaps[0].token_id == token_id)
     scenario.verify(marketplace.data.swaps[0].editions == swapped_editions)
-    scenario.verify(marketplace.data.swaps[0].price == price)
+    scenario.verify(marketplace.data.swaps[0].price == PRICE)
     scenario.verify(sp.len(marketplace.data.swaps[0].donations) == 2)
     scenario.verify(marketplace.data.counter == 1)
 
     # Check that the on-chain views work
     scenario.verify(marketplace.has_swap(0))
-    scenario.verify(marketplace.get_swap(0).issuer == artist1.address)
-    scenario.verify(marketplace.get_swap(0).token_id == token_id)
-    scenario.verify(marketplace.get_swap(0).editions == swapped_editions)
-    scenario.verify(marketplace.get_swap(0).price == price)
-    scenario.verify(sp.len(marketplace.get_swap(0).donations) == 2)
+    swap = scenario.compute(marketplace.get_swap(0))
+    scenario.verify(swap.issuer == artist1.address)
+    scenario.verify(swap.token_id == token_id)
+    scenario.verify(swap.editions == swapped_editions)
+    scenario.verify(swap.price == PRICE)
+    scenario.verify(sp.len(swap.donations) == 2)
     scenario.verify(marketplace.get_swaps_counter() == 1)
 
     # Check that collecting fails if the collector is the swap issuer
-    marketplace.collect(0).run(valid=False, sender=artist1.address, amount=price)
+    marketplace.collect(0).run(valid=False, sender=artist1.address, amount=PRICE)
 
     # Check that collecting fails if the exact tez amount is not provided
-    marketplace.collect(0).run(valid=False, sender=collector1, amount=(price - sp.mutez(1)))
-    marketplace.collect(0).run(valid=False, sender=collector1, amount=(price + sp.mutez(1)))
+    marketplace.collect(0).run(valid=False, sender=collector1, amount=(PRICE - sp.mutez(1)))
+    marketplace.collect(0).run(valid=False, sender=collector1, amount=(PRICE + sp.mutez(1)))
 
     # Collect the token with two different collectors
-    marketplace.collect(0).run(sender=collector1, amount=price)
-    marketplace.collect(0).run(sender=collector2, amount=price)
+    marketplace.collect(0).run(sender=collector1, amount=PRICE)
+    marketplace.collect(0).run(sender=collector2, amount=PRICE)
+
+    # Calculate the tez that each recipient receives per collect
+    fee_cut = sp.split_tokens(PRICE, 25, 1000)
+    org1_cut = sp.split_tokens(PRICE, 100, 1000)
+    org2_cut = sp.split_tokens(PRICE, 300, 1000)
+    royalties_cut = sp.split_tokens(PRICE, royalties, 1000)
 
     # Check that all the tez have been sent and the swaps big map has been updated
     scenario.verify(marketplace.balance == sp.mutez(0))
-    scenario.verify(fee_recipient.balance == sp.mul(2, sp.split_tokens(price, 25, 1000)))
-    scenario.verify(org1.balance == sp.mul(2, sp.split_tokens(price, 100, 1000)))
-    scenario.verify(org2.balance == sp.mul(2, sp.split_tokens(price, 300, 1000)))
-    scenario.verify(artist2.balance == sp.mul(2, sp.split_tokens(price, royalties, 1000)))
-    scenario.verify(artist1.balance == sp.mul(2, price - 
-                                              sp.split_tokens(price, 25, 1000) - 
-                                              sp.split_tokens(price, 100, 1000) - 
-                                              sp.split_tokens(price, 300, 1000) - 
-                                              sp.split_tokens(price, royalties, 1000)))
+    scenario.verify(fee_recipient.balance == sp.mul(2, fee_cut))
+    scenario.verify(org1.balance == sp.mul(2, org1_cut))
+    scenario.verify(org2.balance == sp.mul(2, org2_cut))
+    scenario.verify(artist2.balance == sp.mul(2, royalties_cut))
+    scenario.verify(artist1.balance == sp.mul(
+        2, PRICE - fee_cut - org1_cut - org2_cut - royalties_cut))
     scenario.verify(marketplace.data.swaps[0].editions == swapped_editions - 2)
     scenario.verify(marketplace.get_swap(0).editions == swapped_editions - 2)
 
     # Check that the token ledger information is correct
-    scenario.verify(fa2.data.ledger[(artist1.address, token_id)] == editions - swapped_editions)
-    scenario.verify(fa2.data.ledger[(artist2.address, token_id)] == minted_editions - editions)
-    scenario.verify(fa2.data.ledger[(marketplace.address, token_id)] == swapped_editions - 2)
-    scenario.verify(fa2.data.ledger[(collector1.address, token_id)] == 1)
-    scenario.verify(fa2.data.ledger[(collector2.address, token_id)] == 1)
+    check_balances(scenario, fa2, [
+        (artist1.address, token_id, editions - swapped_editions),
+        (artist2.address, token_id, minted_editions - editions),
+        (marketplace.address, token_id, swapped_editions - 2),
+        (collector1.address, token_id, 1),
+        (collector2.address, token_id, 1)])
 
     # Check that only the swapper can cancel the swap
     marketplace.cancel_swap(0).run(valid=False, sender=collector1)
@@ -236,11 +284,12 @@ def test_swap_and_collect():
     marketplace.cancel_swap(0).run(sender=artist1.address)
 
     # Check that the token ledger information is correct
-    scenario.verify(fa2.data.ledger[(artist1.address, token_id)] == editions - 2)
-    scenario.verify(fa2.data.ledger[(artist2.address, token_id)] == minted_editions - editions)
-    scenario.verify(fa2.data.ledger[(marketplace.address, token_id)] == 0)
-    scenario.verify(fa2.data.ledger[(collector1.address, token_id)] == 1)
-    scenario.verify(fa2.data.ledger[(collector2.address, token_id)] == 1)
+    check_balances(scenario, fa2, [
+        (artist1.address, token_id, editions - 2),
+        (artist2.address, token_id, minted_editions - editions),
+        (marketplace.address, token_id, 0),
+        (collector1.address, token_id, 1),
+        (collector2.address, token_id, 1)])
 
     # Check that the swaps big map has been updated
     scenario.verify(~marketplace.data.swaps.contains(0))
@@ -265,27 +314,15 @@ def test_free_collect():
     marketplace = testEnvironment["marketplace"]
     fee_recipient = testEnvironment["fee_recipient"]
 
-    # Mint a token
+    # Mint a token and add the marketplace contract as an operator
     editions = 100
-    royalties = 100
-    minter.mint(
-        editions=editions,
-        metadata={"": sp.utils.bytes_of_string("ipfs://fff")},
-        data={},
-        royalties=royalties).run(sender=artist1.address)
-
-    # Add the marketplace contract as an operator to be able to swap it
     token_id = 0
-    fa2.update_operators([sp.variant("add_operator", sp.record(
-        owner=artist1.address,
-        operator=marketplace.address,
-        token_id=token_id))]).run(sender=artist1.address)
+    mint_and_approve(fa2, minter, marketplace, artist1, editions, token_id=token_id)
 
     # Swap the token in the marketplace contract for a price of 0 tez
     swapped_editions = 50
     price = sp.mutez(0)
-    donations = [sp.record(address=org1.address, donation=100),
-                 sp.record(address=org2.address, donation=300)]
+    donations = testEnvironment["donations"]
     marketplace.swap(
         token_id=token_id,
         editions=swapped_editions,
@@ -304,9 +341,10 @@ def test_free_collect():
     scenario.verify(marketplace.data.swaps[0].editions == swapped_editions - 1)
 
     # Check that the token ledger information is correct
-    scenario.verify(fa2.data.ledger[(artist1.address, token_id)] == editions - swapped_editions)
-    scenario.verify(fa2.data.ledger[(marketplace.address, token_id)] == swapped_editions - 1)
-    scenario.verify(fa2.data.ledger[(collector1.address, token_id)] == 1)
+    check_balances(scenario, fa2, [
+        (artist1.address, token_id, editions - swapped_editions),
+        (marketplace.address, token_id, swapped_editions - 1),
+        (collector1.address, token_id, 1)])
 
 
 @sp.add_test(name="Test very cheap collect")
@@ -323,27 +361,15 @@ def test_very_cheap_collect():
     marketplace = testEnvironment["marketplace"]
     fee_recipient = testEnvironment["fee_recipient"]
 
-    # Mint a token
+    # Mint a token and add the marketplace contract as an operator
     editions = 100
-    royalties = 100
-    minter.mint(
-        editions=editions,
-        metadata={"": sp.utils.bytes_of_string("ipfs://fff")},
-        data={},
-        royalties=royalties).run(sender=artist1.address)
-
-    # Add the marketplace contract as an operator to be able to swap it
     token_id = 0
-    fa2.update_operators([sp.variant("add_operator", sp.record(
-        owner=artist1.address,
-        operator=marketplace.address,
-        token_id=token_id))]).run(sender=artist1.address)
+    mint_and_approve(fa2, minter, marketplace, artist1, editions, token_id=token_id)
 
     # Swap the token in the marketplace contract for a very cheap price
     swapped_editions = 50
     price = sp.mutez(2)
-    donations = [sp.record(address=org1.address, donation=100),
-                 sp.record(address=org2.address, donation=300)]
+    donations = testEnvironment["donations"]
     marketplace.swap(
         token_id=token_id,
         editions=swapped_editions,
@@ -362,9 +388,10 @@ def test_very_cheap_collect():
     scenario.verify(marketplace.data.swaps[0].editions == swapped_editions - 1)
 
     # Check that the token ledger information is correct
-    scenario.verify(fa2.data.ledger[(artist1.address, token_id)] == editions - swapped_editions)
-    scenario.verify(fa2.data.ledger[(marketplace.address, token_id)] == swapped_editions - 1)
-    scenario.verify(fa2.data.ledger[(collector1.address, token_id)] == 1)
+    check_balances(scenario, fa2, [
+        (artist1.address, token_id, editions - swapped_editions),
+        (marketplace.address, token_id, swapped_editions - 1),
+        (collector1.address, token_id, 1)])
 
 
 @sp.add_test(name="Test update fee")
@@ -479,34 +506,22 @@ def test_set_pause_swaps():
     minter = testEnvironment["minter"]
     marketplace = testEnvironment["marketplace"]
 
-    # Mint a token
+    # Mint a token and add the marketplace contract as an operator
     editions = 100
-    royalties = 100
-    minter.mint(
-        editions=editions,
-        metadata={"": sp.utils.bytes_of_string("ipfs://fff")},
-        data={},
-        royalties=royalties).run(sender=artist1.address)
-
-    # Add the marketplace contract as an operator to be able to swap it
     token_id = 0
-    fa2.update_operators([sp.variant("add_operator", sp.record(
-        owner=artist1.address,
-        operator=marketplace.address,
-        token_id=token_id))]).run(sender=artist1.address)
+    mint_and_approve(fa2, minter, marketplace, artist1, editions, token_id=token_id)
 
     # Swap one token in the marketplace contract
     swapped_editions = 10
-    price = sp.mutez(1000000)
     donations = []
     marketplace.swap(
         token_id=token_id,
         editions=swapped_editions,
-        price=price,
+        price=PRICE,
         donations=donations).run(sender=artist1.address)
 
     # Collect the token
-    marketplace.collect(0).run(sender=collector1, amount=price)
+    marketplace.collect(0).run(sender=collector1, amount=PRICE)
 
     # Pause the swaps and make sure only the admin can do it
     marketplace.set_pause_swaps(True).run(valid=False, sender=collector1)
@@ -521,11 +536,11 @@ def test_set_pause_swaps():
     marketplace.swap(
         token_id=token_id,
         editions=swapped_editions,
-        price=price,
+        price=PRICE,
         donations=donations).run(valid=False, sender=artist1.address)
 
     # Check that collecting is still allowed
-    marketplace.collect(0).run(sender=collector1, amount=price)
+    marketplace.collect(0).run(sender=collector1, amount=PRICE)
 
     # Check that cancel swaps are still allowed
     marketplace.cancel_swap(0).run(sender=artist1.address)
@@ -537,9 +552,9 @@ def test_set_pause_swaps():
     marketplace.swap(
         token_id=token_id,
         editions=swapped_editions,
-        price=price,
+        price=PRICE,
         donations=donations).run(sender=artist1.address)
-    marketplace.collect(1).run(sender=collector1, amount=price)
+    marketplace.collect(1).run(sender=collector1, amount=PRICE)
     marketplace.cancel_swap(1).run(sender=artist1.address)
 
 
@@ -555,34 +570,22 @@ def test_set_pause_collects():
     minter = testEnvironment["minter"]
     marketplace = testEnvironment["marketplace"]
 
-    # Mint a token
+    # Mint a token and add the marketplace contract as an operator
     editions = 100
-    royalties = 100
-    minter.mint(
-        editions=editions,
-        metadata={"": sp.utils.bytes_of_string("ipfs://fff")},
-        data={},
-        royalties=royalties).run(sender=artist1.address)
-
-    # Add the marketplace contract as an operator to be able to swap it
     token_id = 0
-    fa2.update_operators([sp.variant("add_operator", sp.record(
-        owner=artist1.address,
-        operator=marketplace.address,
-        token_id=token_id))]).run(sender=artist1.address)
+    mint_and_approve(fa2, minter, marketplace, artist1, editions, token_id=token_id)
 
     # Swap one token in the marketplace contract
     swapped_editions = 10
-    price = sp.mutez(1000000)
     donations = []
     marketplace.swap(
         token_id=token_id,
         editions=swapped_editions,
-        price=price,
+        price=PRICE,
         donations=donations).run(sender=artist1.address)
 
     # Collect the OBJKT
-    marketplace.collect(0).run(sender=collector1, amount=price)
+    marketplace.collect(0).run(sender=collector1, amount=PRICE)
 
     # Pause the collects and make sure only the admin can do it
     marketplace.set_pause_collects(True).run(valid=False, sender=collector1)
@@ -594,13 +597,13 @@ def test_set_pause_collects():
     scenario.verify(marketplace.data.collects_paused)
 
     # Check that collecting is not allowed
-    marketplace.collect(0).run(valid=False, sender=collector1, amount=price)
+    marketplace.collect(0).run(valid=False, sender=collector1, amount=PRICE)
 
     # Check that swapping is still allowed
     marketplace.swap(
         token_id=token_id,
         editions=swapped_editions,
-        price=price,
+        price=PRICE,
         donations=donations).run(sender=artist1.address)
 
     # Check that cancel swaps are still allowed
@@ -613,9 +616,9 @@ def test_set_pause_collects():
     marketplace.swap(
         token_id=token_id,
         editions=swapped_editions,
-        price=price,
+        price=PRICE,
         donations=donations).run(sender=artist1.address)
-    marketplace.collect(2).run(sender=collector1, amount=price)
+    marketplace.collect(2).run(sender=collector1, amount=PRICE)
     marketplace.cancel_swap(2).run(sender=artist1.address)
 
 
@@ -633,29 +636,17 @@ def test_swap_failure_conditions():
     minter = testEnvironment["minter"]
     marketplace = testEnvironment["marketplace"]
 
-    # Mint a token
+    # Mint a token and add the marketplace contract as an operator
     editions = 1
-    royalties = 100
-    minter.mint(
-        editions=editions,
-        metadata={"": sp.utils.bytes_of_string("ipfs://fff")},
-        data={},
-        royalties=royalties).run(sender=artist1.address)
-
-    # Add the marketplace contract as an operator to be able to swap it
     token_id = 0
-    fa2.update_operators([sp.variant("add_operator", sp.record(
-        owner=artist1.address,
-        operator=marketplace.address,
-        token_id=token_id))]).run(sender=artist1.address)
+    mint_and_approve(fa2, minter, marketplace, artist1, editions, token_id=token_id)
 
     # Trying to swap more editions than are available must fail
-    price = sp.mutez(1000000)
     donations = []
     marketplace.swap(
         token_id=token_id,
         editions=editions + 1,
-        price=price,
+        price=PRICE,
         donations=donations).run(valid=False, sender=artist1.address)
 
     # Trying to swap a token for which one doesn't have any editions must fail,
@@ -663,14 +654,14 @@ def test_swap_failure_conditions():
     marketplace.swap(
         token_id=token_id,
         editions=editions,
-        price=price,
+        price=PRICE,
         donations=donations).run(valid=False, sender=admin)
 
     # Cannot swap 0 items
     marketplace.swap(
         token_id=token_id,
         editions=0,
-        price=price,
+        price=PRICE,
         donations=donations).run(valid=False, sender=artist1.address)
 
     # Trying to give too many donations must fail
@@ -679,14 +670,14 @@ def test_swap_failure_conditions():
     marketplace.swap(
         token_id=token_id,
         editions=editions,
-        price=price,
+        price=PRICE,
         donations=too_many_donations).run(valid=False, sender=artist1.address)
 
     # Successfully swap
     marketplace.swap(
         token_id=token_id,
         editions=editions,
-        price=price,
+        price=PRICE,
         donations=donations).run(sender=artist1.address)
 
     # Check that the swap was added
@@ -698,24 +689,13 @@ def test_swap_failure_conditions():
     marketplace.swap(
         token_id=token_id,
         editions=1,
-        price=price,
+        price=PRICE,
         donations=donations).run(valid=False, sender=artist1.address)
 
-    # Mint a multi edition from a second OBJKT
+    # Mint a multi edition from a second OBJKT and approve the marketplace
     editions = 10
-    royalties = 100
-    minter.mint(
-        editions=editions,
-        metadata={"": sp.utils.bytes_of_string("ipfs://fff")},
-        data={},
-        royalties=royalties).run(sender=artist2.address)
-
-    # Add the marketplace contract as an operator to be able to swap it
     token_id = 1
-    fa2.update_operators([sp.variant("add_operator", sp.record(
-        owner=artist2.address,
-        operator=marketplace.address,
-        token_id=token_id))]).run(sender=artist2.address)
+    mint_and_approve(fa2, minter, marketplace, artist2, editions, token_id=token_id)
 
     # Fail to swap second objkt as second artist when too many editions
     price = sp.mutez(12000)
@@ -759,21 +739,10 @@ def test_cancel_swap_failure_conditions():
     minter = testEnvironment["minter"]
     marketplace = testEnvironment["marketplace"]
 
-    # Mint a token
+    # Mint a token and add the marketplace contract as an operator
     editions = 1
-    royalties = 100
-    minter.mint(
-        editions=editions,
-        metadata={"": sp.utils.bytes_of_string("ipfs://fff")},
-        data={},
-        royalties=royalties).run(sender=artist1.address)
-
-    # Add the marketplace contract as an operator to be able to swap it
     token_id = 0
-    fa2.update_operators([sp.variant("add_operator", sp.record(
-        owner=artist1.address,
-        operator=marketplace.address,
-        token_id=token_id))]).run(sender=artist1.address)
+    mint_and_approve(fa2, minter, marketplace, artist1, editions, token_id=token_id)
 
     # Successfully swap
     price = sp.mutez(10000)
@@ -820,21 +789,10 @@ def test_collect_swap_failure_conditions():
     minter = testEnvironment["minter"]
     marketplace = testEnvironment["marketplace"]
 
-    # Mint a token
+    # Mint a token and add the marketplace contract as an operator
     editions = 1
-    royalties = 100
-    minter.mint(
-        editions=editions,
-        metadata={"": sp.utils.bytes_of_string("ipfs://fff")},
-        data={},
-        royalties=royalties).run(sender=artist1.address)
-
-    # Add the marketplace contract as an operator to be able to swap it
     token_id = 0
-    fa2.update_operators([sp.variant("add_operator", sp.record(
-        owner=artist1.address,
-        operator=marketplace.address,
-        token_id=token_id))]).run(sender=artist1.address)
+    mint_and_approve(fa2, minter, marketplace, artist1, editions, token_id=token_id)
 
     # Successfully swap
     price = sp.mutez(100)
@@ -10,41 +10,45 @@ extendedFa2Contract = sp.io.import_script_from_url(
 minterContract = sp.io.import_script_from_url(
     "file:python/contracts/minterContract.py")
 
+# Define the test accounts
+ADMIN = sp.test_account("admin")
+USER1 = sp.test_account("user1")
+USER2 = sp.test_account("user2")
+USER3 = sp.test_account("user3")
+
+# Define the token metadata
+IPFS_AAA = sp.utils.bytes_of_string("ipfs://aaa")
+IPFS_BBB = sp.utils.bytes_of_string("ipfs://bbb")
+
 
 def get_test_environment():
     # Initialize the test scenario
     scenario = sp.test_scenario()
 
-    # Create the test accounts
-    admin = sp.test_account("admin")
-    user1 = sp.test_account("user1")
-    user2 = sp.test_account("user2")
-    user3 = sp.test_account("user3")
-
     # Initialize the extended FA2
     fa2 = extendedFa2Contract.FA2(
-        administrator=admin.address,
+        administrator=ADMIN.address,
         metadata=sp.utils.metadata_of_url("ipfs://aaa"))
     scenario += fa2
 
     # Initialize the minter contract
     minter = minterContract.MinterContract(
-        administrator=admin.address,
+        administrator=ADMIN.address,
         metadata=sp.utils.metadata_of_url("ipfs://bbb"),
         fa2=fa2.address)
     scenario += minter
 
     # Set the minter contract as the admin of the FA2 contract
-    fa2.transfer_administrator(minter.address).run(sender=admin)
-    minter.accept_fa2_administrator().run(sender=admin)
+    fa2.transfer_administrator(minter.address).run(sender=ADMIN)
+    minter.accept_fa2_administrator().run(sender=ADMIN)
 
     # Save all the variables in a test environment dictionary
     testEnvironment = {
         "scenario": scenario,
-        "admin": admin,
-        "user1": user1,
-        "user2": user2,
-        "user3": user3,
+        "admin": ADMIN,
+        "user1": USER1,
+        "user2": USER2,
+        "user3": USER3,
         "fa2": fa2,
         "minter": minter}
 
@@ -63,7 +67,7 @@ def test_mint():
 
     # Check that a normal user can mint
     editions = 5
-    metadata = {"": sp.utils.bytes_of_string("ipfs://aaa")}
+    metadata = {"": IPFS_AAA}
     data = {}
     royalties = 100
     minter.mint(
@@ -99,7 +103,7 @@ def test_mint():
 
     # Mint another token
     new_editions = 10
-    new_metadata = {"": sp.utils.bytes_of_string("ipfs://bbb")}
+    new_metadata = {"": IPFS_BBB}
     new_data = {"code": sp.utils.bytes_of_string("print('hello world')")}
     new_royalties = 150
     minter.mint(
@@ -109,6 +113,8 @@ def test_mint():
         royalties=new_royalties).run(sender=user2)
 
     # Check that the FA2 contract information has been updated
+    token_royalties = scenario.compute(fa2.token_royalties(0))
+    new_token_royalties = scenario.compute(fa2.token_royalties(1))
     scenario.verify(fa2.data.ledger[(user1.address, 0)] == editions)
     scenario.verify(fa2.data.ledger[(user2.address, 1)] == new_editions)
     scenario.verify(fa2.data.supply[0] == editions)
@@ -119,14 +125,14 @@ def test_mint():
     scenario.verify(fa2.data.token_metadata[1].token_info[""] == new_metadata[""])
     scenario.verify(sp.len(fa2.data.token_data[0]) == 0)
     scenario.verify(fa2.data.token_data[1]["code"] == new_data["code"])
-    scenario.verify(fa2.token_royalties(0).minter.address == user1.address)
-    scenario.verify(fa2.token_royalties(0).minter.royalties == 0)
-    scenario.verify(fa2.token_royalties(1).minter.address == user2.address)
-    scenario.verify(fa2.token_royalties(1).minter.royalties == 0)
-    scenario.verify(fa2.token_royalties(0).creator.address == user1.address)
-    scenario.verify(fa2.token_royalties(0).creator.royalties == royalties)
-    scenario.verify(fa2.token_royalties(1).creator.address == user2.address)
-    scenario.verify(fa2.token_royalties(1).creator.royalties == new_royalties)
+    scenario.verify(token_royalties.minter.address == user1.address)
+    scenario.verify(token_royalties.minter.royalties == 0)
+    scenario.verify(new_token_royalties.minter.address == user2.address)
+    scenario.verify(new_token_royalties.minter.royalties == 0)
+    scenario.verify(token_royalties.creator.address == user1.address)
+    scenario.verify(token_royalties.creator.royalties == royalties)
+    scenario.verify(new_token_royalties.creator.address == user2.address)
+    scenario.verify(new_token_royalties.creator.royalties == new_royalties)
 
 
 @sp.add_test(name="Test transfer and accept administrator")
@@ -200,7 +206,7 @@ def test_transfer_and_accept_fa2_administrator():
 
     # Check that minting with the old minter fails
     editions = 5
-    metadata = {"": sp.utils.bytes_of_string("ipfs://aaa")}
+    metadata = {"": IPFS_AAA}
     data = {}
     royalties = 100
     minter.mint(
@@ -236,7 +242,7 @@ def test_set_pause():
 
     # Check that minting fails
     editions = 5
-    metadata = {"": sp.utils.bytes_of_string("ipfs://aaa")}
+    metadata = {"": IPFS_AAA}
     data = {}
     royalties = 100
     minter.mint(
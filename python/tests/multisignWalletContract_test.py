@@ -10,6 +10,20 @@ multisigWalletContract = sp.io.import_script_from_url(
 fa2Contract = sp.io.import_script_from_url(
     "file:python/templates/fa2Contract.py")
 
+# Define the test accounts
+USER1 = sp.test_account("user1")
+USER2 = sp.test_account("user2")
+USER3 = sp.test_account("user3")
+USER4 = sp.test_account("user4")
+NON_USER = sp.test_account("non_user")
+USER5 = sp.test_account("user5")
+ADMIN = sp.test_account("admin")
+RECEPTOR1 = sp.test_account("receptor1")
+RECEPTOR2 = sp.test_account("receptor2")
+
+# Define the initial multisig wallet users
+USERS = sp.set([USER1.address, USER2.address, USER3.address, USER4.address])
+
 
 class RecipientContract(sp.Contract):
     """This contract simulates a user that can recive tez transfers.
@@ -64,17 +78,10 @@ class DummyContract(sp.Contract):
 
 
 def get_test_environment():
-    # Create the test accounts
-    user1 = sp.test_account("user1")
-    user2 = sp.test_account("user2")
-    user3 = sp.test_account("user3")
-    user4 = sp.test_account("user4")
-    non_user = sp.test_account("non_user")
-
     # Initialize the multisig wallet contract
     multisig = multisigWalletContract.MultisigWalletContract(
         metadata=sp.utils.metadata_of_url("ipfs://aaa"),
-        users=sp.set([user1.address, user2.address, user3.address, user4.address]),
+        users=USERS,
         minimum_votes=3,
         expiration_time=3)
 
@@ -88,17 +95,39 @@ def get_test_environment():
     # Save all the variables in a test environment dictionary
     testEnvironment = {
         "scenario" : scenario,
-        "user1" : user1,
-        "user2" : user2,
-        "user3" : user3,
-        "user4" : user4,
-        "user4" : user4,
-        "non_user" : non_user,
+        "user1" : USER1,
+        "user2" : USER2,
+        "user3" : USER3,
+        "user4" : USER4,
+        "non_user" : NON_USER,
+        "user5" : USER5,
+        "admin" : ADMIN,
+        "receptor1" : RECEPTOR1,
+        "receptor2" : RECEPTOR2,
         "multisig" : multisig}
 
     return testEnvironment
 
 
+def vote_request(proposal_id, user):
+    """Returns a proposal vote request record.
+
+    """
+    return sp.record(proposal_id=proposal_id, user=user)
+
+
+def vote_and_execute_proposal(multisig, proposal_id, votes, executor):
+    """Votes a proposal with the given list of (user, approval) votes and
+    executes it from the executor account.
+
+    """
+    for user, approval in votes:
+        multisig.vote_proposal(
+            proposal_id=proposal_id, approval=approval).run(sender=user)
+
+    multisig.execute_proposal(proposal_id).run(sender=executor)
+
+
 @sp.add_test(name="Test default entripoint")
 def test_default_entripoint():
     # Get the test environment
@@ -172,13 +201,13 @@ def test_create_vote_and_execute_proposal():
     scenario.verify(multisig.data.votes[(0, user1.address)] == True)
     scenario.verify(multisig.data.votes[(0, user2.address)] == True)
     scenario.verify(multisig.data.votes[(0, user3.address)] == False)
-    scenario.verify(multisig.get_vote(sp.record(proposal_id=0, user=user1.address)) == True)
-    scenario.verify(multisig.get_vote(sp.record(proposal_id=0, user=user2.address)) == True)
-    scenario.verify(multisig.get_vote(sp.record(proposal_id=0, user=user3.address)) == False)
-    scenario.verify(multisig.has_voted(sp.record(proposal_id=0, user=user1.address)))
-    scenario.verify(multisig.has_voted(sp.record(proposal_id=0, user=user2.address)))
-    scenario.verify(multisig.has_voted(sp.record(proposal_id=0, user=user3.address)))
-    scenario.verify(~multisig.has_voted(sp.record(proposal_id=0, user=user4.address)))
+    scenario.verify(multisig.get_vote(vote_request(0, user1.address)) == True)
+    scenario.verify(multisig.get_vote(vote_request(0, user2.address)) == True)
+    scenario.verify(multisig.get_vote(vote_request(0, user3.address)) == False)
+    scenario.verify(multisig.has_voted(vote_request(0, user1.address)))
+    scenario.verify(multisig.has_voted(vote_request(0, user2.address)))
+    scenario.verify(multisig.has_voted(vote_request(0, user3.address)))
+    scenario.verify(~multisig.has_voted(vote_request(0, user4.address)))
     scenario.verify(multisig.data.proposals[0].positive_votes == 2)
     scenario.verify(~multisig.data.proposals[0].executed)
 
@@ -211,7 +240,7 @@ def test_create_vote_and_execute_proposal():
     multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user4)
 
     # Check that the vote has been added
-    scenario.verify(multisig.has_voted(sp.record(proposal_id=0, user=user4.address)))
+    scenario.verify(multisig.has_voted(vote_request(0, user4.address)))
     scenario.verify(multisig.data.votes[(0, user4.address)] == True)
     scenario.verify(multisig.data.proposals[0].positive_votes == 3)
     scenario.verify(~multisig.data.proposals[0].executed)
@@ -242,8 +271,8 @@ def test_create_vote_and_execute_proposal():
     scenario.verify(multisig.get_proposal(1).positive_votes == 1)
     scenario.verify(~multisig.data.proposals[1].executed)
     scenario.verify(~multisig.get_proposal(1).executed)
-    scenario.verify(multisig.get_vote(sp.record(proposal_id=1, user=non_user.address)) == True)
-    scenario.verify(multisig.has_voted(sp.record(proposal_id=1, user=non_user.address)))
+    scenario.verify(multisig.get_vote(vote_request(1, non_user.address)) == True)
+    scenario.verify(multisig.has_voted(vote_request(1, non_user.address)))
 
     # The other users vote the proposal
     multisig.vote_proposal(proposal_id=1, approval=True).run(sender=user1, now=sp.timestamp(2000))
@@ -271,14 +300,9 @@ def test_text_proposal():
     text = sp.pack("ipfs://zzz")
     multisig.text_proposal(text).run(sender=user1)
 
-    # Vote for the proposal
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user1)
-    multisig.vote_proposal(proposal_id=0, approval=False).run(sender=user2)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user3)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user4)
-
-    # Execute the proposal
-    multisig.execute_proposal(0).run(sender=user3)
+    # Vote and execute the proposal
+    vote_and_execute_proposal(
+        multisig, 0, [(user1, True), (user2, False), (user3, True), (user4, True)], user3)
 
     # Check that the proposal is listed as executed
     scenario.verify(multisig.data.proposals[0].executed)
@@ -308,14 +332,9 @@ def test_transfer_mutez_proposal():
         sp.record(amount=sp.tez(2), destination=recipient2.address)])
     multisig.transfer_mutez_proposal(mutez_transfers).run(sender=user1)
 
-    # Vote for the proposal
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user1)
-    multisig.vote_proposal(proposal_id=0, approval=False).run(sender=user2)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user3)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user4)
-
-    # Execute the proposal
-    multisig.execute_proposal(0).run(sender=user3)
+    # Vote and execute the proposal
+    vote_and_execute_proposal(
+        multisig, 0, [(user1, True), (user2, False), (user3, True), (user4, True)], user3)
 
     # Check that the proposal is listed as executed
     scenario.verify(multisig.data.proposals[0].executed)
@@ -337,10 +356,12 @@ def test_transfer_token_proposal():
     user2 = testEnvironment["user2"]
     user3 = testEnvironment["user3"]
     user4 = testEnvironment["user4"]
+    admin = testEnvironment["admin"]
+    receptor1 = testEnvironment["receptor1"]
+    receptor2 = testEnvironment["receptor2"]
     multisig = testEnvironment["multisig"]
 
     # Create the FA2 token contract and add it to the test scenario
-    admin = sp.test_account("admin")
     fa2 = fa2Contract.FA2(
         config=fa2Contract.FA2_config(),
         admin=admin.address,
@@ -366,10 +387,6 @@ def test_transfer_token_proposal():
     scenario.verify(fa2.data.ledger[(user1.address, 0)].balance == 100 - 20)
     scenario.verify(fa2.data.ledger[(multisig.address, 0)].balance == 20)
 
-    # Create the accounts that will receive the token transfers
-    receptor1 = sp.test_account("receptor1")
-    receptor2 = sp.test_account("receptor2")
-
     # Add a transfer token proposal
     token_transfers = sp.record(
         fa2=fa2.address,
@@ -379,14 +396,9 @@ def test_transfer_token_proposal():
             sp.record(amount=sp.nat(1), destination=receptor2.address)]))
     multisig.transfer_token_proposal(token_transfers).run(sender=user3)
 
-    # Vote for the proposal
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user1)
-    multisig.vote_proposal(proposal_id=0, approval=False).run(sender=user2)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user3)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user4)
-
-    # Execute the proposal
-    multisig.execute_proposal(0).run(sender=user3)
+    # Vote and execute the proposal
+    vote_and_execute_proposal(
+        multisig, 0, [(user1, True), (user2, False), (user3, True), (user4, True)], user3)
 
     # Check that the proposal is listed as executed
     scenario.verify(multisig.data.proposals[0].executed)
@@ -415,14 +427,9 @@ def test_minimum_votes_proposal():
     # Add a minimum votes proposal
     multisig.minimum_votes_proposal(4).run(sender=user4)
 
-    # Vote for the proposal
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user1)
-    multisig.vote_proposal(proposal_id=0, approval=False).run(sender=user2)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user3)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user4)
-
-    # Execute the proposal
-    multisig.execute_proposal(0).run(sender=user3)
+    # Vote and execute the proposal
+    vote_and_execute_proposal(
+        multisig, 0, [(user1, True), (user2, False), (user3, True), (user4, True)], user3)
 
     # Check that the minimum votes parameter has been updated
     scenario.verify(multisig.data.minimum_votes == 4)
@@ -444,14 +451,9 @@ def test_minimum_votes_proposal():
     # Add a remove user proposal
     multisig.remove_user_proposal(user1.address).run(sender=user4)
 
-    # Vote for the proposal
-    multisig.vote_proposal(proposal_id=2, approval=True).run(sender=user1)
-    multisig.vote_proposal(proposal_id=2, approval=True).run(sender=user2)
-    multisig.vote_proposal(proposal_id=2, approval=True).run(sender=user3)
-    multisig.vote_proposal(proposal_id=2, approval=True).run(sender=user4)
-
-    # Execute the proposal
-    multisig.execute_proposal(2).run(sender=user3)
+    # Vote and execute the proposal
+    vote_and_execute_proposal(
+        multisig, 2, [(user1, True), (user2, True), (user3, True), (user4, True)], user3)
 
     # Check that the minimum votes parameter has been updated
     scenario.verify(multisig.data.minimum_votes == 3)
@@ -475,14 +477,9 @@ def test_expiration_time_proposal():
     # Add an expiration time proposal
     multisig.expiration_time_proposal(100).run(sender=user4)
 
-    # Vote for the proposal
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user1)
-    multisig.vote_proposal(proposal_id=0, approval=False).run(sender=user2)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user3)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user4)
-
-    # Execute the proposal
-    multisig.execute_proposal(0).run(sender=user3)
+    # Vote and execute the proposal
+    vote_and_execute_proposal(
+        multisig, 0, [(user1, True), (user2, False), (user3, True), (user4, True)], user3)
 
     # Check that the expiration time parameter has been updated
     scenario.verify(multisig.data.expiration_time == 100)
@@ -498,29 +495,22 @@ def test_add_user_proposal():
     user2 = testEnvironment["user2"]
     user3 = testEnvironment["user3"]
     user4 = testEnvironment["user4"]
+    user5 = testEnvironment["user5"]
     multisig = testEnvironment["multisig"]
 
-    # Create the new user account
-    user5 = sp.test_account("user5")
-
     # Check that it's not possible to add the same user twice
     multisig.add_user_proposal(user1.address).run(valid=False, sender=user4)
 
     # Add a add user proposal
     multisig.add_user_proposal(user5.address).run(sender=user4)
 
-    # Vote for the proposal
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user1)
-    multisig.vote_proposal(proposal_id=0, approval=False).run(sender=user2)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user3)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user4)
-
-    # Execute the proposal
-    multisig.execute_proposal(0).run(sender=user3)
+    # Vote and execute the proposal
+    vote_and_execute_proposal(
+        multisig, 0, [(user1, True), (user2, False), (user3, True), (user4, True)], user3)
 
     # Check that now there are 5 users
-    scenario.verify(sp.len(multisig.data.users.elements()) == 5)
-    scenario.verify(sp.len(multisig.get_users().elements()) == 5)
+    scenario.verify(sp.len(multisig.data.users) == 5)
+    scenario.verify(sp.len(multisig.get_users()) == 5)
     scenario.verify(multisig.get_users().contains(user5.address))
     scenario.verify(multisig.is_user(user5.address))
 
@@ -534,29 +524,22 @@ def test_remove_user_proposal():
     user2 = testEnvironment["user2"]
     user3 = testEnvironment["user3"]
     user4 = testEnvironment["user4"]
+    user5 = testEnvironment["user5"]
     multisig = testEnvironment["multisig"]
 
-    # Create the new user account
-    user5 = sp.test_account("user5")
-
     # Check that it's not possible to remove a user that is not in the multisig
     multisig.remove_user_proposal(user5.address).run(valid=False, sender=user4)
 
     # Add a remove user proposal
     multisig.remove_user_proposal(user2.address).run(sender=user4)
 
-    # Vote for the proposal
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user1)
-    multisig.vote_proposal(proposal_id=0, approval=False).run(sender=user2)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user3)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user4)
-
-    # Execute the proposal
-    multisig.execute_proposal(0).run(sender=user3)
+    # Vote and execute the proposal
+    vote_and_execute_proposal(
+        multisig, 0, [(user1, True), (user2, False), (user3, True), (user4, True)], user3)
 
     # Check that now there are 3 users
-    scenario.verify(sp.len(multisig.data.users.elements()) == 3)
-    scenario.verify(sp.len(multisig.get_users().elements()) == 3)
+    scenario.verify(sp.len(multisig.data.users) == 3)
+    scenario.verify(sp.len(multisig.get_users()) == 3)
     scenario.verify(~multisig.get_users().contains(user2.address))
     scenario.verify(~multisig.is_user(user2.address))
 
@@ -585,14 +568,9 @@ def test_lambda_function_proposal():
     # Add a lambda proposal
     multisig.lambda_function_proposal(dummy_lambda_function).run(sender=user4)
 
-    # Vote for the proposal
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user1)
-    multisig.vote_proposal(proposal_id=0, approval=False).run(sender=user2)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user3)
-    multisig.vote_proposal(proposal_id=0, approval=True).run(sender=user4)
-
-    # Execute the proposal
-    multisig.execute_proposal(0).run(sender=user3)
+    # Vote and execute the proposal
+    vote_and_execute_proposal(
+        multisig, 0, [(user1, True), (user2, False), (user3, True), (user4, True)], user3)
 
     # Check that the dummy contract storage has been updated to the correct vale
     scenario.verify(dummyContract.data.x == 2)
@@ -10,19 +10,37 @@ patientContract = sp.io.import_script_from_url(
 doctorContract = sp.io.import_script_from_url(
     "file:python/contracts/doctorContract.py")
 
+# Define the test accounts
+DOCTOR = sp.test_account("doctor")
+FRIEND = sp.test_account("friend")
 
-@sp.add_test(name="Test initialization")
-def test_initialization():
-    # Define the doctor account
-    doctor = sp.test_account("doctor")
 
+def get_test_environment():
     # Initialize the contract
-    c = patientContract.PatientContract(doctor.address)
+    c = patientContract.PatientContract(DOCTOR.address)
 
     # Add the contract to the test scenario
     scenario = sp.test_scenario()
     scenario += c
 
+    # Save all the variables in a test environment dictionary
+    testEnvironment = {
+        "scenario" : scenario,
+        "doctor" : DOCTOR,
+        "friend" : FRIEND,
+        "c" : c}
+
+    return testEnvironment
+
+
+@sp.add_test(name="Test initialization")
+def test_initialization():
+    # Get the test environment
+    testEnvironment = get_test_environment()
+    scenario = testEnvironment["scenario"]
+    doctor = testEnvironment["doctor"]
+    c = testEnvironment["c"]
+
     # Check that the information in the contract strorage is correct
     scenario.verify(c.data.doctor == doctor.address)
     scenario.verify(~c.data.illness.is_some())
@@ -30,15 +48,10 @@ def test_initialization():
 
 @sp.add_test(name="Test get sick")
 def test_get_sick():
-    # Define the doctor account
-    doctor = sp.test_account("doctor")
-
-    # Initialize the contract
-    c = patientContract.PatientContract(doctor.address)
-
-    # Add the contract to the test scenario
-    scenario = sp.test_scenario()
-    scenario += c
+    # Get the test environment
+    testEnvironment = get_test_environment()
+    scenario = testEnvironment["scenario"]
+    c = testEnvironment["c"]
 
     # Make the patient sick
     c.get_sick("cold")
@@ -53,16 +66,12 @@ def test_get_sick():
 
 @sp.add_test(name="Test get medicament")
 def test_get_medicament():
-    # Define the test accounts
-    doctor = sp.test_account("doctor")
-    friend = sp.test_account("friend")
-
-    # Initialize the contract
-    c = patientContract.PatientContract(doctor.address)
-
-    # Add the contract to the test scenario
-    scenario = sp.test_scenario()
-    scenario += c
+    # Get the test environment
+    testEnvironment = get_test_environment()
+    scenario = testEnvironment["scenario"]
+    doctor = testEnvironment["doctor"]
+    friend = testEnvironment["friend"]
+    c = testEnvironment["c"]
 
     # Make the patient sick
     c.get_sick("cold")
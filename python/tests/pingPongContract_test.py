@@ -8,21 +8,23 @@ import smartpy as sp
 pingPongContract = sp.io.import_script_from_url(
     "file:python/contracts/pingPongContract.py")
 
+# Define the test accounts
+PLAYER = sp.address("tz1Player")
+PLAYER_1 = sp.address("tz1Player1")
+PLAYER_2 = sp.address("tz1Player2")
+
 
 @sp.add_test(name="Test player initialization")
 def test_player_initialization():
-    # Define the test account
-    player = sp.address("tz1Player")
-
     # Initialize the contract
-    player_contract = pingPongContract.PlayerContract(player)
+    player_contract = pingPongContract.PlayerContract(PLAYER)
 
     # Add the contract to the test scenario
     scenario = sp.test_scenario()
     scenario += player_contract
 
     # Check that the information in the contract strorage is correct
-    scenario.verify(player_contract.data.player == player)
+    scenario.verify(player_contract.data.player == PLAYER)
     scenario.verify(sp.len(player_contract.data.games) == 0)
     scenario.verify(player_contract.data.moves["ping"] == "pong")
     scenario.verify(player_contract.data.moves["pong"] == "ping")
@@ -43,13 +45,9 @@ def test_court_initialization():
 
 @sp.add_test(name="Test register game")
 def test_register_game():
-    # Define the test accounts
-    player_1 = sp.address("tz1Player1")
-    player_2 = sp.address("tz1Player2")
-
     # Initialize the contracts
-    player_1_contract = pingPongContract.PlayerContract(player_1)
-    player_2_contract = pingPongContract.PlayerContract(player_2)
+    player_1_contract = pingPongContract.PlayerContract(PLAYER_1)
+    player_2_contract = pingPongContract.PlayerContract(PLAYER_2)
     court_contract = pingPongContract.CourtContract()
 
     # Add the scontracts to the test scenario
@@ -88,13 +86,9 @@ def test_register_game():
 
 @sp.add_test(name="Test accept game")
 def test_accept_game():
-    # Define the test accounts
-    player_1 = sp.address("tz1Player1")
-    player_2 = sp.address("tz1Player2")
-
     # Initialize the contracts
-    player_1_contract = pingPongContract.PlayerContract(player_1)
-    player_2_contract = pingPongContract.PlayerContract(player_2)
+    player_1_contract = pingPongContract.PlayerContract(PLAYER_1)
+    player_2_contract = pingPongContract.PlayerContract(PLAYER_2)
     court_contract = pingPongContract.CourtContract()
 
     # Add the scontracts to the test scenario
@@ -122,13 +116,9 @@ def test_accept_game():
 
 @sp.add_test(name="Test add game")
 def test_add_game():
-    # Define the test accounts
-    player_1 = sp.address("tz1Player1")
-    player_2 = sp.address("tz1Player2")
-
     # Initialize the contracts
-    player_1_contract = pingPongContract.PlayerContract(player_1)
-    player_2_contract = pingPongContract.PlayerContract(player_2)
+    player_1_contract = pingPongContract.PlayerContract(PLAYER_1)
+    player_2_contract = pingPongContract.PlayerContract(PLAYER_2)
     court_contract = pingPongContract.CourtContract()
 
     # Add the scontracts to the test scenario
@@ -147,10 +137,10 @@ def test_add_game():
     # Add the game to the two players
     player_1_contract.add_game(sp.record(
         game_id=game_id, court=court_contract.address,
-        opponent=player_2_contract.address)).run(sender=player_1)
+        opponent=player_2_contract.address)).run(sender=PLAYER_1)
     player_2_contract.add_game(sp.record(
         game_id=game_id, court=court_contract.address,
-        opponent=player_1_contract.address)).run(sender=player_2)
+        opponent=player_1_contract.address)).run(sender=PLAYER_2)
 
     # Check that the information in the contract strorages is correct
     scenario.verify(sp.len(player_1_contract.data.games) == 1)
@@ -169,13 +159,9 @@ def test_add_game():
 
 @sp.add_test(name="Test play game")
 def test_play_game():
-    # Define the test accounts
-    player_1 = sp.address("tz1Player1")
-    player_2 = sp.address("tz1Player2")
-
     # Initialize the contracts
-    player_1_contract = pingPongContract.PlayerContract(player_1)
-    player_2_contract = pingPongContract.PlayerContract(player_2)
+    player_1_contract = pingPongContract.PlayerContract(PLAYER_1)
+    player_2_contract = pingPongContract.PlayerContract(PLAYER_2)
     court_contract = pingPongContract.CourtContract()
 
     # Add the scontracts to the test scenario
@@ -194,13 +180,13 @@ def test_play_game():
     # Add the game to the two players
     player_1_contract.add_game(sp.record(
         game_id=game_id, court=court_contract.address,
-        opponent=player_2_contract.address)).run(sender=player_1)
+        opponent=player_2_contract.address)).run(sender=PLAYER_1)
     player_2_contract.add_game(sp.record(
         game_id=game_id, court=court_contract.address,
-        opponent=player_1_contract.address)).run(sender=player_2)
+        opponent=player_1_contract.address)).run(sender=PLAYER_2)
 
     # Play one game
-    player_1_contract.play_game(game_id).run(sender=player_1)
+    player_1_contract.play_game(game_id).run(sender=PLAYER_1)
 
     # Check that the information in the contract strorages is correct
     scenario.verify(player_1_contract.data.games[game_id].ball_hits == 3)
@@ -212,7 +198,7 @@ def test_play_game():
     scenario.verify(game.played_games == 1)
 
     # Play another game
-    player_2_contract.play_game(game_id).run(sender=player_2)
+    player_2_contract.play_game(game_id).run(sender=PLAYER_2)
 
     # Check that the information in the contract strorages is correct
     scenario.verify(player_1_contract.data.games[game_id].ball_hits == 2)
@@ -224,7 +210,7 @@ def test_play_game():
     scenario.verify(game.played_games == 2)
 
     # Play another game
-    player_2_contract.play_game(game_id).run(sender=player_2)
+    player_2_contract.play_game(game_id).run(sender=PLAYER_2)
 
     # Check that the information in the contract strorages is correct
     scenario.verify(player_1_contract.data.games[game_id].ball_hits == 2)
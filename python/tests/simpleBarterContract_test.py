@@ -10,22 +10,27 @@ simpleBarterContract = sp.io.import_script_from_url(
 fa2Contract = sp.io.import_script_from_url(
     "file:python/templates/fa2Contract.py")
 
+# Define the test accounts
+USER1 = sp.test_account("user1")
+USER2 = sp.test_account("user2")
+USER3 = sp.test_account("user3")
+FA2_ADMIN = sp.test_account("fa2_admin")
+
+# Define the token metadata
+IPFS_CCC = sp.utils.bytes_of_string("ipfs://ccc")
+IPFS_DDD = sp.utils.bytes_of_string("ipfs://ddd")
+IPFS_EEE = sp.utils.bytes_of_string("ipfs://eee")
 
-def get_test_environment():
-    # Create the test accounts
-    user1 = sp.test_account("user1")
-    user2 = sp.test_account("user2")
-    user3 = sp.test_account("user3")
-    fa2_admin = sp.test_account("fa2_admin")
 
+def get_test_environment():
     # Initialize the two FA2 contracts
     fa2_1 = fa2Contract.FA2(
         config=fa2Contract.FA2_config(),
-        admin=fa2_admin.address,
+        admin=FA2_ADMIN.address,
         metadata=sp.utils.metadata_of_url("ipfs://aaa"))
     fa2_2 = fa2Contract.FA2(
         config=fa2Contract.FA2_config(),
-        admin=fa2_admin.address,
+        admin=FA2_ADMIN.address,
         metadata=sp.utils.metadata_of_url("ipfs://bbb"))
 
     # Initialize the simple barter contract
@@ -38,20 +43,80 @@ def get_test_environment():
     scenario += fa2_2
     scenario += barter
 
+    # Define the tokens used in the trade proposals
+    tokens = sp.list([
+        sp.record(fa2=fa2_1.address, id=sp.nat(0), amount=sp.nat(1)),
+        sp.record(fa2=fa2_1.address, id=sp.nat(1), amount=sp.nat(2)),
+        sp.record(fa2=fa2_2.address, id=sp.nat(0), amount=sp.nat(2))])
+    for_tokens = sp.list([
+        sp.record(fa2=fa2_2.address, id=sp.nat(1), amount=sp.nat(10))])
+
     # Save all the variables in a test environment dictionary
     testEnvironment = {
         "scenario" : scenario,
-        "user1" : user1,
-        "user2" : user2,
-        "user3" : user3,
-        "fa2_admin" : fa2_admin,
+        "user1" : USER1,
+        "user2" : USER2,
+        "user3" : USER3,
+        "fa2_admin" : FA2_ADMIN,
         "fa2_1" : fa2_1,
         "fa2_2" : fa2_2,
-        "barter" : barter}
+        "barter" : barter,
+        "tokens" : tokens,
+        "for_tokens" : for_tokens}
 
     return testEnvironment
 
 
+def mint_tokens(fa2_1, fa2_2, fa2_admin, owner, second_owner):
+    """Mints 100 editions of two tokens in each FA2 contract. The second token
+    of the second FA2 contract is minted to the second owner.
+
+    """
+    fa2_1.mint(
+        address=owner.address,
+        token_id=sp.nat(0),
+        amount=sp.nat(100),
+        metadata={"" : IPFS_CCC}).run(sender=fa2_admin)
+    fa2_1.mint(
+        address=owner.address,
+        token_id=sp.nat(1),
+        amount=sp.nat(100),
+        metadata={"" : IPFS_DDD}).run(sender=fa2_admin)
+    fa2_2.mint(
+        address=owner.address,
+        token_id=sp.nat(0),
+        amount=sp.nat(100),
+        metadata={"" : IPFS_EEE}).run(sender=fa2_admin)
+    fa2_2.mint(
+        address=second_owner.address,
+        token_id=sp.nat(1),
+        amount=sp.nat(100),
+        metadata={"" : IPFS_EEE}).run(sender=fa2_admin)
+
+
+def add_operators(fa2, owner, operator, token_ids):
+    """Adds an operator to the owner tokens with a single FA2 operators
+    update.
+
+    """
+    fa2.update_operators([
+        sp.variant("add_operator", fa2.operator_param.make(
+            owner=owner.address,
+            operator=operator,
+            token_id=token_id)) for token_id in token_ids]).run(sender=owner)
+
+
+def check_balances(scenario, fa2, balances):
+    """Checks a list of (owner, token_id, balance) token balances against
+    the balance field of the given FA2 contract ledger entries, one scenario
+    verification per balance.
+
+    """
+    for owner, token_id, balance in balances:
+        scenario.verify(
+            fa2.data.ledger[(owner, token_id)].balance == balance)
+
+
 @sp.add_test(name="Test trade with second user")
 def test_trade_with_second_user():
     # Get the test environment
@@ -64,28 +129,11 @@ def test_trade_with_second_user():
     fa2_1 = testEnvironment["fa2_1"]
     fa2_2 = testEnvironment["fa2_2"]
     barter = testEnvironment["barter"]
+    tokens = testEnvironment["tokens"]
+    for_tokens = testEnvironment["for_tokens"]
 
     # Mint some tokens
-    fa2_1.mint(
-        address=user1.address,
-        token_id=sp.nat(0),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://ccc")}).run(sender=fa2_admin)
-    fa2_1.mint(
-        address=user1.address,
-        token_id=sp.nat(1),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://ddd")}).run(sender=fa2_admin)
-    fa2_2.mint(
-        address=user1.address,
-        token_id=sp.nat(0),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://eee")}).run(sender=fa2_admin)
-    fa2_2.mint(
-        address=user2.address,
-        token_id=sp.nat(1),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://eee")}).run(sender=fa2_admin)
+    mint_tokens(fa2_1, fa2_2, fa2_admin, user1, user2)
 
     # Transfer some tokens to the first and third user
     fa2_2.transfer(sp.list([sp.record(
@@ -95,71 +143,43 @@ def test_trade_with_second_user():
             sp.record(to_=user3.address, token_id=1, amount=30)]))])).run(sender=user2)
 
     # Add the barter contract as operator for the tokens
-    fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=0)),
-        sp.variant("add_operator", fa2_1.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=1))]).run(sender=user1)
-    fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=0)),
-        sp.variant("add_operator", fa2_2.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=1))]).run(sender=user1)
-    fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
-            owner=user2.address,
-            operator=barter.address,
-            token_id=1))]).run(sender=user2)
-    fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
-            owner=user3.address,
-            operator=barter.address,
-            token_id=1))]).run(sender=user3)
+    add_operators(fa2_1, user1, barter.address, [0, 1])
+    add_operators(fa2_2, user1, barter.address, [0, 1])
+    add_operators(fa2_2, user2, barter.address, [1])
+    add_operators(fa2_2, user3, barter.address, [1])
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 30)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 40)
-    scenario.verify(fa2_2.data.ledger[(user3.address, 1)].balance == 30)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100),
+        (user1.address, 1, 100)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100),
+        (user1.address, 1, 30),
+        (user2.address, 1, 40),
+        (user3.address, 1, 30)])
 
     # Propose a trade with the second user
     barter.propose_trade(
-        tokens=sp.list([
-            sp.record(fa2=fa2_1.address, id=sp.nat(0), amount=sp.nat(1)),
-            sp.record(fa2=fa2_1.address, id=sp.nat(1), amount=sp.nat(2)),
-            sp.record(fa2=fa2_2.address, id=sp.nat(0), amount=sp.nat(2))]),
-        for_tokens=sp.list([
-            sp.record(fa2=fa2_2.address, id=sp.nat(1), amount=sp.nat(10))]),
+        tokens=tokens,
+        for_tokens=for_tokens,
         with_user=sp.some(user2.address)).run(valid=False, sender=user1, amount=sp.tez(3))
     barter.propose_trade(
-        tokens=sp.list([
-            sp.record(fa2=fa2_1.address, id=sp.nat(0), amount=sp.nat(1)),
-            sp.record(fa2=fa2_1.address, id=sp.nat(1), amount=sp.nat(2)),
-            sp.record(fa2=fa2_2.address, id=sp.nat(0), amount=sp.nat(2))]),
-        for_tokens=sp.list([
-            sp.record(fa2=fa2_2.address, id=sp.nat(1), amount=sp.nat(10))]),
+        tokens=tokens,
+        for_tokens=for_tokens,
         with_user=sp.some(user2.address)).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100 - 1)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 30)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 40)
-    scenario.verify(fa2_2.data.ledger[(user3.address, 1)].balance == 30)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 0)].balance == 1)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 1)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(barter.address, 0)].balance == 2)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100 - 1),
+        (user1.address, 1, 100 - 2),
+        (barter.address, 0, 1),
+        (barter.address, 1, 2)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100 - 2),
+        (user1.address, 1, 30),
+        (user2.address, 1, 40),
+        (user3.address, 1, 30),
+        (barter.address, 0, 2)])
 
     # Check that the first and third users cannot accept the trade because they
     # are not the assigned second user
@@ -171,18 +191,20 @@ def test_trade_with_second_user():
     barter.accept_trade(0).run(sender=user2)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100 - 1)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 30 + 10)
-    scenario.verify(fa2_1.data.ledger[(user2.address, 0)].balance == 1)
-    scenario.verify(fa2_1.data.ledger[(user2.address, 1)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 40 - 10)
-    scenario.verify(fa2_2.data.ledger[(user3.address, 1)].balance == 30)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 0)].balance == 0)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 1)].balance == 0)
-    scenario.verify(fa2_2.data.ledger[(barter.address, 0)].balance == 0)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100 - 1),
+        (user1.address, 1, 100 - 2),
+        (user2.address, 0, 1),
+        (user2.address, 1, 2),
+        (barter.address, 0, 0),
+        (barter.address, 1, 0)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100 - 2),
+        (user1.address, 1, 30 + 10),
+        (user2.address, 0, 2),
+        (user2.address, 1, 40 - 10),
+        (user3.address, 1, 30),
+        (barter.address, 0, 0)])
 
     # Check that the second user cannot accept twice the trade
     barter.accept_trade(0).run(valid=False, sender=user2)
@@ -200,74 +222,41 @@ def test_trade_without_second_user():
     fa2_1 = testEnvironment["fa2_1"]
     fa2_2 = testEnvironment["fa2_2"]
     barter = testEnvironment["barter"]
+    tokens = testEnvironment["tokens"]
+    for_tokens = testEnvironment["for_tokens"]
 
     # Mint some tokens
-    fa2_1.mint(
-        address=user1.address,
-        token_id=sp.nat(0),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://ccc")}).run(sender=fa2_admin)
-    fa2_1.mint(
-        address=user1.address,
-        token_id=sp.nat(1),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://ddd")}).run(sender=fa2_admin)
-    fa2_2.mint(
-        address=user1.address,
-        token_id=sp.nat(0),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://eee")}).run(sender=fa2_admin)
-    fa2_2.mint(
-        address=user2.address,
-        token_id=sp.nat(1),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://eee")}).run(sender=fa2_admin)
+    mint_tokens(fa2_1, fa2_2, fa2_admin, user1, user2)
 
     # Add the barter contract as operator for the tokens
-    fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=0)),
-        sp.variant("add_operator", fa2_1.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=1))]).run(sender=user1)
-    fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=0))]).run(sender=user1)
-    fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
-            owner=user2.address,
-            operator=barter.address,
-            token_id=1))]).run(sender=user2)
+    add_operators(fa2_1, user1, barter.address, [0, 1])
+    add_operators(fa2_2, user1, barter.address, [0])
+    add_operators(fa2_2, user2, barter.address, [1])
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100),
+        (user1.address, 1, 100)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100),
+        (user2.address, 1, 100)])
 
     # Propose a trade with no specific second user
     barter.propose_trade(
-        tokens=sp.list([
-            sp.record(fa2=fa2_1.address, id=sp.nat(0), amount=sp.nat(1)),
-            sp.record(fa2=fa2_1.address, id=sp.nat(1), amount=sp.nat(2)),
-            sp.record(fa2=fa2_2.address, id=sp.nat(0), amount=sp.nat(2))]),
-        for_tokens=sp.list([
-            sp.record(fa2=fa2_2.address, id=sp.nat(1), amount=sp.nat(10))]),
+        tokens=tokens,
+        for_tokens=for_tokens,
         with_user=sp.none).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100 - 1)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 0)].balance == 1)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 1)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(barter.address, 0)].balance == 2)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100 - 1),
+        (user1.address, 1, 100 - 2),
+        (barter.address, 0, 1),
+        (barter.address, 1, 2)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100 - 2),
+        (user2.address, 1, 100),
+        (barter.address, 0, 2)])
 
     # Check that the first and third users cannot accept the trade because they
     # don't own the requested token
@@ -278,17 +267,19 @@ def test_trade_without_second_user():
     barter.accept_trade(0).run(sender=user2)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100 - 1)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 10)
-    scenario.verify(fa2_1.data.ledger[(user2.address, 0)].balance == 1)
-    scenario.verify(fa2_1.data.ledger[(user2.address, 1)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 0)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100 - 10)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 0)].balance == 0)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 1)].balance == 0)
-    scenario.verify(fa2_2.data.ledger[(barter.address, 0)].balance == 0)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100 - 1),
+        (user1.address, 1, 100 - 2),
+        (user2.address, 0, 1),
+        (user2.address, 1, 2),
+        (barter.address, 0, 0),
+        (barter.address, 1, 0)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100 - 2),
+        (user1.address, 1, 10),
+        (user2.address, 0, 2),
+        (user2.address, 1, 100 - 10),
+        (barter.address, 0, 0)])
 
     # Check that the second user cannot accept twice the trade
     barter.accept_trade(0).run(valid=False, sender=user2)
@@ -304,85 +295,54 @@ def test_trade_same_user():
     fa2_1 = testEnvironment["fa2_1"]
     fa2_2 = testEnvironment["fa2_2"]
     barter = testEnvironment["barter"]
+    tokens = testEnvironment["tokens"]
+    for_tokens = testEnvironment["for_tokens"]
 
     # Mint some tokens
-    fa2_1.mint(
-        address=user1.address,
-        token_id=sp.nat(0),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://ccc")}).run(sender=fa2_admin)
-    fa2_1.mint(
-        address=user1.address,
-        token_id=sp.nat(1),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://ddd")}).run(sender=fa2_admin)
-    fa2_2.mint(
-        address=user1.address,
-        token_id=sp.nat(0),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://eee")}).run(sender=fa2_admin)
-    fa2_2.mint(
-        address=user1.address,
-        token_id=sp.nat(1),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://eee")}).run(sender=fa2_admin)
+    mint_tokens(fa2_1, fa2_2, fa2_admin, user1, user1)
 
     # Add the barter contract as operator for the tokens
-    fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=0)),
-        sp.variant("add_operator", fa2_1.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=1))]).run(sender=user1)
-    fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=0)),
-        sp.variant("add_operator", fa2_2.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=1))]).run(sender=user1)
+    add_operators(fa2_1, user1, barter.address, [0, 1])
+    add_operators(fa2_2, user1, barter.address, [0, 1])
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 100)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100),
+        (user1.address, 1, 100)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100),
+        (user1.address, 1, 100)])
 
     # Propose a trade with no specific second user
     barter.propose_trade(
-        tokens=sp.list([
-            sp.record(fa2=fa2_1.address, id=sp.nat(0), amount=sp.nat(1)),
-            sp.record(fa2=fa2_1.address, id=sp.nat(1), amount=sp.nat(2)),
-            sp.record(fa2=fa2_2.address, id=sp.nat(0), amount=sp.nat(2))]),
-        for_tokens=sp.list([
-            sp.record(fa2=fa2_2.address, id=sp.nat(1), amount=sp.nat(10))]),
+        tokens=tokens,
+        for_tokens=for_tokens,
         with_user=sp.none).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100 - 1)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 0)].balance == 1)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 1)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(barter.address, 0)].balance == 2)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100 - 1),
+        (user1.address, 1, 100 - 2),
+        (barter.address, 0, 1),
+        (barter.address, 1, 2)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100 - 2),
+        (user1.address, 1, 100),
+        (barter.address, 0, 2)])
 
     # The first user accepts its own trade
     barter.accept_trade(0).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 0)].balance == 0)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 1)].balance == 0)
-    scenario.verify(fa2_2.data.ledger[(barter.address, 0)].balance == 0)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100),
+        (user1.address, 1, 100),
+        (barter.address, 0, 0),
+        (barter.address, 1, 0)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100),
+        (user1.address, 1, 100),
+        (barter.address, 0, 0)])
 
     # Check that the first user cannot accept twice the trade
     barter.accept_trade(0).run(valid=False, sender=user1)
@@ -398,74 +358,41 @@ def test_cancel_trade():
     fa2_1 = testEnvironment["fa2_1"]
     fa2_2 = testEnvironment["fa2_2"]
     barter = testEnvironment["barter"]
+    tokens = testEnvironment["tokens"]
+    for_tokens = testEnvironment["for_tokens"]
 
     # Mint some tokens
-    fa2_1.mint(
-        address=user1.address,
-        token_id=sp.nat(0),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://ccc")}).run(sender=fa2_admin)
-    fa2_1.mint(
-        address=user1.address,
-        token_id=sp.nat(1),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://ddd")}).run(sender=fa2_admin)
-    fa2_2.mint(
-        address=user1.address,
-        token_id=sp.nat(0),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://eee")}).run(sender=fa2_admin)
-    fa2_2.mint(
-        address=user2.address,
-        token_id=sp.nat(1),
-        amount=sp.nat(100),
-        metadata={"" : sp.utils.bytes_of_string("ipfs://eee")}).run(sender=fa2_admin)
+    mint_tokens(fa2_1, fa2_2, fa2_admin, user1, user2)
 
     # Add the barter contract as operator for the tokens
-    fa2_1.update_operators(
-        [sp.variant("add_operator", fa2_1.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=0)),
-        sp.variant("add_operator", fa2_1.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=1))]).run(sender=user1)
-    fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
-            owner=user1.address,
-            operator=barter.address,
-            token_id=0))]).run(sender=user1)
-    fa2_2.update_operators(
-        [sp.variant("add_operator", fa2_2.operator_param.make(
-            owner=user2.address,
-            operator=barter.address,
-            token_id=1))]).run(sender=user2)
+    add_operators(fa2_1, user1, barter.address, [0, 1])
+    add_operators(fa2_2, user1, barter.address, [0])
+    add_operators(fa2_2, user2, barter.address, [1])
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100),
+        (user1.address, 1, 100)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100),
+        (user2.address, 1, 100)])
 
     # Propose a trade with the second user
     barter.propose_trade(
-        tokens=sp.list([
-            sp.record(fa2=fa2_1.address, id=sp.nat(0), amount=sp.nat(1)),
-            sp.record(fa2=fa2_1.address, id=sp.nat(1), amount=sp.nat(2)),
-            sp.record(fa2=fa2_2.address, id=sp.nat(0), amount=sp.nat(2))]),
-        for_tokens=sp.list([
-            sp.record(fa2=fa2_2.address, id=sp.nat(1), amount=sp.nat(10))]),
+        tokens=tokens,
+        for_tokens=for_tokens,
         with_user=sp.some(user2.address)).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100 - 1)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100 - 2)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 0)].balance == 1)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 1)].balance == 2)
-    scenario.verify(fa2_2.data.ledger[(barter.address, 0)].balance == 2)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100 - 1),
+        (user1.address, 1, 100 - 2),
+        (barter.address, 0, 1),
+        (barter.address, 1, 2)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100 - 2),
+        (user2.address, 1, 100),
+        (barter.address, 0, 2)])
 
     # Check that the second user cannot cancel the trade
     barter.cancel_trade(0).run(valid=False, sender=user2)
@@ -475,13 +402,15 @@ def test_cancel_trade():
     barter.cancel_trade(0).run(sender=user1)
 
     # Check that the OBJKT ledger information is correct
-    scenario.verify(fa2_1.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(user1.address, 1)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user1.address, 0)].balance == 100)
-    scenario.verify(fa2_2.data.ledger[(user2.address, 1)].balance == 100)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 0)].balance == 0)
-    scenario.verify(fa2_1.data.ledger[(barter.address, 1)].balance == 0)
-    scenario.verify(fa2_2.data.ledger[(barter.address, 0)].balance == 0)
+    check_balances(scenario, fa2_1, [
+        (user1.address, 0, 100),
+        (user1.address, 1, 100),
+        (barter.address, 0, 0),
+        (barter.address, 1, 0)])
+    check_balances(scenario, fa2_2, [
+        (user1.address, 0, 100),
+        (user2.address, 1, 100),
+        (barter.address, 0, 0)])
 
     # Check that the first user cannot cancel the trade again
     barter.cancel_trade(0).run(valid=False, sender=user1)